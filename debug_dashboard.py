@@ -6,8 +6,9 @@ Shows connection status and data flow
 
 import streamlit as st
 import plotly.graph_objects as go
+import numpy as np
 from plotly.subplots import make_subplots
-import json
+import orjson
 import time
 import subprocess
 import threading
@@ -15,9 +16,73 @@ import queue
 import os
 import sys
 import re
-from collections import deque
+import select
+import selectors
+from collections import deque, namedtuple
 from datetime import datetime
 
+# Number of telemetry points kept for plotting
+TELEMETRY_WINDOW = 100
+
+# Fixed-layout record for one telemetry point in the plotting window
+TELEMETRY_DTYPE = np.dtype([
+    ('ts', 'f8'),
+    ('vbat', 'f4'),
+    ('rssi', 'f4'),
+    ('uptime', 'f4')
+])
+
+# Refresh cadence of the live telemetry panels
+REFRESH_INTERVAL = "2s"
+
+# Bytes requested from the BeepSat pipe per read
+READ_CHUNK_SIZE = 65536
+
+# Fields the dashboard reads from each packet, unpacked once at parse time
+TelemetryPoint = namedtuple(
+    'TelemetryPoint', ['timestamp', 'battery_voltage', 'last_rssi', 'uptime_seconds']
+)
+
+class TelemetryRing:
+    """Single-producer/single-consumer ring buffer for telemetry handoff"""
+
+    __slots__ = ('buffer', 'head', 'tail', 'mask')
+
+    def __init__(self, size=128):
+        # Size is a power of two so indices wrap with a mask instead of modulo
+        self.buffer = [None] * size
+        self.head = 0
+        self.tail = 0
+        self.mask = size - 1
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def put(self, item):
+        """Add an item from the producer thread, dropping it if the ring is full"""
+        if self.tail - self.head > self.mask:
+            return False
+        self.buffer[self.tail & self.mask] = item
+        self.tail += 1
+        return True
+
+    def drain(self):
+        """Take every buffered item in one burst, oldest first"""
+        head, tail = self.head, self.tail
+        if head == tail:
+            return []
+        start, end = head & self.mask, tail & self.mask
+        if start < end:
+            batch = self.buffer[start:end]
+        else:
+            batch = self.buffer[start:] + self.buffer[:end]
+        self.head = tail
+        return batch
+
+    def clear(self):
+        """Discard everything currently buffered"""
+        self.head = self.tail
+
 # Configure page
 st.set_page_config(
     page_title="BeepSat Debug Dashboard",
@@ -28,104 +93,206 @@ st.set_page_config(
 # Initialize session state
 if 'monitoring' not in st.session_state:
     st.session_state.monitoring = False
-if 'telemetry_data' not in st.session_state:
-    st.session_state.telemetry_data = deque(maxlen=100)
+if 'tel' not in st.session_state:
+    st.session_state.tel = np.zeros(TELEMETRY_WINDOW, dtype=TELEMETRY_DTYPE)
+    st.session_state.tel_idx = 0
+    st.session_state.tel_n = 0
 if 'current_data' not in st.session_state:
-    st.session_state.current_data = {}
-if 'beepsat_process' not in st.session_state:
-    st.session_state.beepsat_process = None
+    st.session_state.current_data = None
+if 'stop_pipe' not in st.session_state:
+    st.session_state.stop_pipe = None
 if 'data_queue' not in st.session_state:
-    st.session_state.data_queue = queue.Queue()
+    st.session_state.data_queue = TelemetryRing()
 if 'debug_messages' not in st.session_state:
     st.session_state.debug_messages = deque(maxlen=20)
+if 'pending_debug' not in st.session_state:
+    st.session_state.pending_debug = deque(maxlen=256)
 if 'raw_lines' not in st.session_state:
     st.session_state.raw_lines = deque(maxlen=10)
+if 'raw_capture' not in st.session_state:
+    st.session_state.raw_capture = threading.Event()
+if 'voltage_fig' not in st.session_state:
+    st.session_state.voltage_fig = None
+
+# Telemetry marker and JSON payload, matched per line across a whole block of raw bytes
+TELEMETRY_PATTERN = re.compile(rb'(?:TELEMETRY_OUTPUT:|TELEM:)[^{\r\n]*(\{[^\r\n]*)')
+
+# Non-telemetry BeepSat lines worth echoing to the debug log
+INTERESTING_LINE_PATTERN = re.compile(
+    rb'^(?![^\r\n]*TELEM)[^\r\n]*(?:tasks loaded|Running|Battery:|IMU)[^\r\n]*',
+    re.MULTILINE
+)
+
+def to_local_datetime64(timestamps):
+    """Convert epoch seconds to local-time datetime64 values for plotting"""
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    return ((timestamps + offset) * 1000).astype('datetime64[ms]')
+
+def format_debug_message(timestamp, msg):
+    """Render a debug log entry for an epoch timestamp"""
+    return f"[{datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]}] {msg}"
 
 def add_debug_message(msg):
     """Add debug message with timestamp"""
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-    st.session_state.debug_messages.append(f"[{timestamp}] {msg}")
-
-def parse_telemetry_line(line):
-    """Extract JSON from telemetry output"""
-    if 'TELEMETRY_OUTPUT:' in line or 'TELEM:' in line:
-        json_start = line.find('{')
-        if json_start != -1:
-            json_data = line[json_start:]
-            try:
-                data = json.loads(json_data)
-                return data
-            except json.JSONDecodeError as e:
-                add_debug_message(f"JSON decode error: {e}")
+    st.session_state.debug_messages.append(format_debug_message(time.time(), msg))
+
+def flush_debug_messages():
+    """Move debug messages queued by the monitor thread into the log in one batch"""
+    pending = st.session_state.pending_debug
+    batch = [pending.popleft() for _ in range(len(pending))]
+    if batch:
+        timestamps, messages = zip(*batch)
+        # One vectorized conversion for the whole batch; keep the HH:MM:SS.mmm part
+        clock = np.datetime_as_string(to_local_datetime64(np.array(timestamps)), unit='ms')
+        st.session_state.debug_messages.extend(
+            f"[{stamp[11:]}] {msg}" for stamp, msg in zip(clock, messages)
+        )
+
+def extract_telemetry_point(data):
+    """Flatten the nested packet dict into the fields the dashboard displays"""
+    # "or {}" also covers sections sent as null
+    power_status = data.get('power_status') or {}
+    radio_status = data.get('radio_status') or {}
+    return TelemetryPoint(
+        timestamp=data.get('timestamp', time.time()),
+        battery_voltage=power_status.get('battery_voltage', 0),
+        last_rssi=radio_status.get('last_rssi', 'N/A'),
+        uptime_seconds=power_status.get('uptime_seconds', 0)
+    )
+
+def find_telemetry_payloads(block):
+    """Return the raw JSON bytes of every telemetry line in a block of output"""
+    # Both markers start with TELEM; skip blocks of ordinary log lines before the regex
+    if b'TELEM' not in block:
+        return []
+    return TELEMETRY_PATTERN.findall(block)
+
+def decode_telemetry_payload(payload, log=add_debug_message):
+    """Decode a raw JSON payload into a TelemetryPoint"""
+    try:
+        return extract_telemetry_point(orjson.loads(payload))
+    except orjson.JSONDecodeError as e:
+        log(f"JSON decode error: {e}")
+    except (AttributeError, TypeError, ValueError) as e:
+        # Valid JSON with an unexpected shape; skip it rather than end the decoder thread
+        log(f"Malformed telemetry packet: {e}: {payload[:80]!r}")
     return None
 
-def monitor_beepsat():
+def read_blocks(fd, stop_fd):
+    """Yield runs of complete raw output lines until EOF or a byte arrives on stop_fd"""
+    selector = selectors.DefaultSelector()
+    selector.register(fd, selectors.EVENT_READ)
+    selector.register(stop_fd, selectors.EVENT_READ)
+    pending = bytearray()
+    try:
+        while True:
+            ready = [key.fd for key, _ in selector.select()]
+            if stop_fd in ready:
+                return
+            chunk = os.read(fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            pending.extend(chunk)
+            # Hand over everything up to the last newline; keep the partial line
+            end = pending.rfind(b'\n') + 1
+            if end:
+                yield bytes(pending[:end])
+                del pending[:end]
+        if pending:
+            yield bytes(pending)
+    finally:
+        selector.close()
+
+def monitor_beepsat(stop_fd, pending_debug, ring, raw_lines, raw_capture):
     """Monitor BeepSat with detailed debugging"""
     basic_dir = "software_example_beepsat/basic"
     
-    add_debug_message("Starting BeepSat monitoring thread")
+    def log(msg):
+        # Timestamp only; formatting happens when the script run flushes the batch
+        pending_debug.append((time.time(), msg))
+    
+    log("Starting BeepSat monitoring thread")
     
     if not os.path.exists(basic_dir):
-        add_debug_message(f"ERROR: Directory {basic_dir} not found")
+        log(f"ERROR: Directory {basic_dir} not found")
+        os.close(stop_fd)
         return
     
     try:
-        add_debug_message("Starting BeepSat process...")
+        log("Starting BeepSat process...")
         process = subprocess.Popen(
             [sys.executable, "main_emulated.py"],
             cwd=basic_dir,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
+            stderr=subprocess.STDOUT
         )
         
-        st.session_state.beepsat_process = process
-        add_debug_message("BeepSat process started successfully")
+        log("BeepSat process started successfully")
         
         line_count = 0
         telemetry_count = 0
         
-        while st.session_state.monitoring and process.poll() is None:
-            try:
-                line = process.stdout.readline()
-                if line:
-                    line_count += 1
-                    clean_line = line.strip()
-                    
-                    # Store raw lines for debugging
-                    st.session_state.raw_lines.append(clean_line)
-                    
-                    # Try to parse telemetry
-                    data = parse_telemetry_line(line)
-                    if data:
-                        telemetry_count += 1
-                        st.session_state.data_queue.put(data)
-                        add_debug_message(f"Telemetry parsed #{telemetry_count}")
-                    
-                    # Log interesting lines
-                    if any(keyword in clean_line for keyword in ['tasks loaded', 'Running', 'Battery:', 'IMU']):
-                        add_debug_message(f"BeepSat: {clean_line}")
-                        
-                elif process.poll() is not None:
-                    add_debug_message("BeepSat process ended")
-                    break
-                    
-            except Exception as e:
-                add_debug_message(f"Monitoring error: {e}")
-                break
+        # Decoding runs on its own thread so a slow parse never stalls the pipe reader
+        payloads = queue.SimpleQueue()
+        
+        def decode_payloads():
+            nonlocal telemetry_count
+            ring_put = ring.put
+            while (payload := payloads.get()) is not None:
+                point = decode_telemetry_payload(payload, log)
+                if point:
+                    telemetry_count += 1
+                    ring_put(point)
+                    log(f"Telemetry parsed #{telemetry_count}")
+        
+        decoder = threading.Thread(target=decode_payloads, daemon=True)
+        decoder.start()
         
-        add_debug_message(f"Monitoring stopped. Lines: {line_count}, Telemetry: {telemetry_count}")
+        # Bind hot-loop targets once so each block costs a local lookup
+        raw_capture_enabled = raw_capture.is_set
+        raw_extend = raw_lines.extend
+        payload_put = payloads.put
+        
+        try:
+            # Each pass handles a whole block of lines with C-level scans
+            for block in read_blocks(process.stdout.fileno(), stop_fd):
+                line_count += block.count(b'\n')
+                
+                # Store raw lines for debugging, only while the raw view is enabled
+                if raw_capture_enabled():
+                    raw_extend(block.decode('utf-8', errors='replace').splitlines())
+                
+                # Hand telemetry payloads to the decoder thread
+                for payload in find_telemetry_payloads(block):
+                    payload_put(payload)
+                
+                # Log interesting lines
+                for match in INTERESTING_LINE_PATTERN.finditer(block):
+                    log(f"BeepSat: {match.group().decode('utf-8', errors='replace')}")
+            
+            # No pending stop byte means BeepSat closed its output on its own
+            if not select.select([stop_fd], [], [], 0)[0]:
+                log("BeepSat process ended")
+                
+        except Exception as e:
+            log(f"Monitoring error: {e}")
+        
+        # Let the decoder finish what is queued before reporting totals
+        payloads.put(None)
+        decoder.join()
+        
+        log(f"Monitoring stopped. Lines: {line_count}, Telemetry: {telemetry_count}")
         
         # Cleanup
         if process and process.poll() is None:
             process.terminate()
             process.wait(timeout=5)
-            add_debug_message("BeepSat process terminated")
+            log("BeepSat process terminated")
             
     except Exception as e:
-        add_debug_message(f"Failed to start BeepSat: {e}")
+        log(f"Failed to start BeepSat: {e}")
+    finally:
+        os.close(stop_fd)
 
 def start_monitoring():
     """Start monitoring with debug output"""
@@ -134,11 +301,22 @@ def start_monitoring():
         add_debug_message("🚀 Starting mission monitoring")
         
         # Clear old data
-        while not st.session_state.data_queue.empty():
-            st.session_state.data_queue.get()
+        st.session_state.data_queue.clear()
         
-        # Start monitoring thread
-        thread = threading.Thread(target=monitor_beepsat, daemon=True)
+        # Start monitoring thread, woken through the stop pipe on shutdown
+        stop_r, stop_w = os.pipe()
+        st.session_state.stop_pipe = stop_w
+        thread = threading.Thread(
+            target=monitor_beepsat,
+            args=(
+                stop_r,
+                st.session_state.pending_debug,
+                st.session_state.data_queue,
+                st.session_state.raw_lines,
+                st.session_state.raw_capture
+            ),
+            daemon=True
+        )
         thread.start()
 
 def stop_monitoring():
@@ -147,24 +325,50 @@ def stop_monitoring():
         st.session_state.monitoring = False
         add_debug_message("🛑 Stopping mission monitoring")
         
-        if st.session_state.beepsat_process:
+        # Wake the monitor thread; it terminates the BeepSat process itself
+        if st.session_state.stop_pipe is not None:
             try:
-                st.session_state.beepsat_process.terminate()
-                add_debug_message("BeepSat process terminated")
-            except:
+                os.write(st.session_state.stop_pipe, b'\0')
+            except OSError:
                 pass
+            os.close(st.session_state.stop_pipe)
+            st.session_state.stop_pipe = None
+
+def build_voltage_figure():
+    """Create the battery voltage figure once; later refreshes only swap its data"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=[],
+        y=[],
+        mode='lines+markers',
+        name='Battery Voltage',
+        line=dict(color='cyan', width=2)
+    ))
+    fig.update_layout(
+        height=300,
+        xaxis_title="Time",
+        yaxis_title="Voltage (V)",
+        showlegend=False
+    )
+    return fig
 
 def process_data_queue():
     """Process telemetry data from queue"""
+    flush_debug_messages()
+    
+    batch = st.session_state.data_queue.drain()
+    tel = st.session_state.tel
+    idx = st.session_state.tel_idx
     processed_count = 0
-    while not st.session_state.data_queue.empty():
-        try:
-            data = st.session_state.data_queue.get_nowait()
-            st.session_state.telemetry_data.append(data)
-            st.session_state.current_data = data
-            processed_count += 1
-        except queue.Empty:
-            break
+    for point in batch:
+        rssi = np.nan if point.last_rssi == 'N/A' else point.last_rssi
+        tel[idx] = (point.timestamp, point.battery_voltage, rssi, point.uptime_seconds)
+        idx = (idx + 1) % TELEMETRY_WINDOW
+        st.session_state.current_data = point
+        processed_count += 1
+    
+    st.session_state.tel_idx = idx
+    st.session_state.tel_n = min(st.session_state.tel_n + processed_count, TELEMETRY_WINDOW)
     
     if processed_count > 0:
         add_debug_message(f"Processed {processed_count} telemetry packets")
@@ -174,9 +378,6 @@ def process_data_queue():
 # Main dashboard
 st.title("🛰️ BeepSat Debug Dashboard")
 
-# Process any new data
-new_data_count = process_data_queue()
-
 # Control panel
 col1, col2, col3 = st.columns(3)
 
@@ -198,91 +399,85 @@ with col3:
     status = "🟢 ACTIVE" if st.session_state.monitoring else "🔴 INACTIVE"
     st.write(f"Status: {status}")
 
-# Statistics
-st.write("---")
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    st.metric("Telemetry Points", len(st.session_state.telemetry_data))
-with col2:
-    st.metric("Queue Size", st.session_state.data_queue.qsize())
-with col3:
-    st.metric("Debug Messages", len(st.session_state.debug_messages))
-with col4:
-    st.metric("Monitoring", "Yes" if st.session_state.monitoring else "No")
-
-# Current telemetry
-if st.session_state.current_data:
-    st.write("---")
-    st.subheader("📡 Current Telemetry")
-    
-    power_status = st.session_state.current_data.get('power_status', {})
-    radio_status = st.session_state.current_data.get('radio_status', {})
+# Only tick while a mission is running; otherwise the panel redraws on interaction
+@st.fragment(run_every=REFRESH_INTERVAL if st.session_state.monitoring else None)
+def refresh_panel():
+    """Redraw the telemetry panels without rerunning the whole script"""
+    # Process any new data
+    new_data_count = process_data_queue()
     
+    # Statistics
+    st.write("---")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        battery_v = power_status.get('battery_voltage', 0)
-        st.metric("🔋 Battery", f"{battery_v:.2f} V")
+        st.metric("Telemetry Points", st.session_state.tel_n)
     with col2:
-        rssi = radio_status.get('last_rssi', 'N/A')
-        st.metric("📡 RSSI", f"{rssi} dBm")
+        st.metric("Queue Size", len(st.session_state.data_queue))
     with col3:
-        uptime = power_status.get('uptime_seconds', 0)
-        st.metric("⏰ Uptime", f"{uptime:.1f} s")
+        st.metric("Debug Messages", len(st.session_state.debug_messages))
     with col4:
-        timestamp = st.session_state.current_data.get('timestamp', 0)
-        age = time.time() - timestamp
-        st.metric("🕐 Data Age", f"{age:.1f} s")
+        st.metric("Monitoring", "Yes" if st.session_state.monitoring else "No")
 
-# Debug information
-st.write("---")
-col1, col2 = st.columns(2)
+    # Current telemetry
+    if st.session_state.current_data:
+        st.write("---")
+        st.subheader("📡 Current Telemetry")
+    
+        point = st.session_state.current_data
+    
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("🔋 Battery", f"{point.battery_voltage:.2f} V")
+        with col2:
+            st.metric("📡 RSSI", f"{point.last_rssi} dBm")
+        with col3:
+            st.metric("⏰ Uptime", f"{point.uptime_seconds:.1f} s")
+        with col4:
+            age = time.time() - point.timestamp
+            st.metric("🕐 Data Age", f"{age:.1f} s")
 
-with col1:
-    st.subheader("🐛 Debug Messages")
-    if st.session_state.debug_messages:
-        debug_text = "\n".join(list(st.session_state.debug_messages))
-        st.text_area("Debug Log", debug_text, height=300, disabled=True)
-    else:
-        st.info("No debug messages yet")
+    # Debug information
+    st.write("---")
+    col1, col2 = st.columns(2)
 
-with col2:
-    st.subheader("📜 Raw BeepSat Output")
-    if st.session_state.raw_lines:
-        raw_text = "\n".join(list(st.session_state.raw_lines))
-        st.text_area("Raw Output", raw_text, height=300, disabled=True)
-    else:
-        st.info("No raw output yet")
+    with col1:
+        st.subheader("🐛 Debug Messages")
+        if st.session_state.debug_messages:
+            debug_text = "\n".join(list(st.session_state.debug_messages))
+            st.text_area("Debug Log", debug_text, height=300, disabled=True)
+        else:
+            st.info("No debug messages yet")
 
-# Simple plot if we have data
-if len(st.session_state.telemetry_data) > 1:
-    st.write("---")
-    st.subheader("📈 Battery Voltage Trend")
-    
-    data_list = list(st.session_state.telemetry_data)
-    timestamps = []
-    voltages = []
+    with col2:
+        st.subheader("📜 Raw BeepSat Output")
+        if st.checkbox("Capture raw output", key="debug_view_enabled"):
+            st.session_state.raw_capture.set()
+        else:
+            st.session_state.raw_capture.clear()
     
-    for data in data_list:
-        timestamps.append(datetime.fromtimestamp(data.get('timestamp', time.time())))
-        power_status = data.get('power_status', {})
-        voltages.append(power_status.get('battery_voltage', 0))
+        if st.session_state.raw_lines:
+            raw_text = "\n".join(list(st.session_state.raw_lines))
+            st.text_area("Raw Output", raw_text, height=300, disabled=True)
+        else:
+            st.info("No raw output yet")
+
+    # Simple plot if we have data
+    if st.session_state.tel_n > 1:
+        st.write("---")
+        st.subheader("📈 Battery Voltage Trend")
     
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=timestamps, 
-        y=voltages,
-        mode='lines+markers',
-        name='Battery Voltage',
-        line=dict(color='cyan', width=2)
-    ))
-    fig.update_layout(
-        height=300,
-        xaxis_title="Time",
-        yaxis_title="Voltage (V)",
-        showlegend=False
-    )
-    st.plotly_chart(fig, use_container_width=True)
+        if st.session_state.voltage_fig is None:
+            st.session_state.voltage_fig = build_voltage_figure()
+        fig = st.session_state.voltage_fig
+        
+        # Only rebuild the trace data when new packets arrived since the last tick
+        if new_data_count or not len(fig.data[0].x):
+            # Unroll the circular record buffer into time order
+            n = st.session_state.tel_n
+            window = np.roll(st.session_state.tel, -st.session_state.tel_idx)[-n:]
+            with fig.batch_update():
+                fig.data[0].x = to_local_datetime64(window['ts'])
+                fig.data[0].y = window['vbat']
+        st.plotly_chart(fig, use_container_width=True)
 
-# Auto-refresh
-time.sleep(2)
-st.rerun()
\ No newline at end of file
+refresh_panel()
\ No newline at end of file
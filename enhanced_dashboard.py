@@ -7,7 +7,6 @@ Real-time monitoring with comprehensive statistical insights
 import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import plotly.express as px
 import numpy as np
 import pandas as pd
 import json
@@ -15,11 +14,20 @@ import time
 import os
 import sys
 import random
+import threading
+import weakref
 from collections import deque
+from itertools import islice
 from datetime import datetime
 import statistics
 from scipy import stats
 
+# Numba is optional; without it the anomaly scan falls back to plain NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="BeepSat Mission Control",
@@ -76,6 +84,49 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Telemetry history kept for plots and statistics
+TELEMETRY_WINDOW = 200
+METRIC_FIELDS = ('timestamps', 'battery_voltages', 'rssi_values', 'error_counts', 'uptime_values')
+ANALYZED_FIELDS = ('battery_voltages', 'rssi_values', 'error_counts')
+
+# Ring column dtypes; epoch timestamps keep float64 for sub-second precision
+RING_DTYPES = {
+    'timestamps': np.float64,
+    'battery_voltages': np.float32,
+    'rssi_values': np.float32,
+    'error_counts': np.int16,
+    'uptime_values': np.float32
+}
+
+# Uniform draws generated per refill of the simulator's random pool
+RANDOM_POOL_SIZE = 4096
+
+# Simulated orbit, sampled at the 2 Hz telemetry rate for the RSSI fading table
+ORBITAL_PERIOD = 300  # 5 minute "orbit" for demo
+ORBITAL_SAMPLES = ORBITAL_PERIOD * 2
+
+# Seconds between packets from the background telemetry producer (2 Hz)
+TELEMETRY_PERIOD = 0.5
+
+# Refresh cadence of the live panels while a mission is running
+REFRESH_INTERVAL = "1s"
+
+def to_local_datetime64(timestamps):
+    """Convert epoch seconds to local-time datetime64 values for plotting"""
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    return ((timestamps + offset) * 1000).astype('datetime64[ms]')
+
+def telemetry_row(telemetry):
+    """Pull one ring row out of a telemetry packet, in METRIC_FIELDS order"""
+    power = telemetry['power_status']
+    return (
+        telemetry['timestamp'],
+        power['battery_voltage'],
+        telemetry['radio_status']['last_rssi'],
+        telemetry['nvm_counters']['state_errors'],
+        power['uptime_seconds']
+    )
+
 class BeepSatSimulator:
     """Enhanced BeepSat simulator with more realistic behavior"""
     
@@ -102,10 +153,33 @@ class BeepSatSimulator:
         self.rssi_variation = 10
         self.rssi_trend = 0
         
+        # ±8 dBm orbital variation, one entry per half second of the orbit
+        self.orbital_table = (8 * np.sin(
+            np.linspace(0, 2 * np.pi, ORBITAL_SAMPLES, endpoint=False)
+        )).tolist()
+        
         # Anomaly simulation
         self.anomaly_probability = 0.002  # 0.2% chance per reading
         self.last_anomaly_time = 0
         
+        # Per-tick randomness is drawn from a pre-generated batch
+        self.rng = np.random.default_rng()
+        self.random_pool = self.rng.random(RANDOM_POOL_SIZE).tolist()
+        self.pool_index = 0
+        
+    def _random(self):
+        """Next uniform draw in [0, 1) from the pool, refilling it when exhausted"""
+        if self.pool_index == RANDOM_POOL_SIZE:
+            self.random_pool = self.rng.random(RANDOM_POOL_SIZE).tolist()
+            self.pool_index = 0
+        value = self.random_pool[self.pool_index]
+        self.pool_index += 1
+        return value
+    
+    def _uniform(self, low, high):
+        """Uniform draw in [low, high) from the pool"""
+        return low + (high - low) * self._random()
+    
     def get_battery_voltage(self, current_time):
         """Calculate realistic battery voltage with occasional anomalies"""
         # Slow discharge over time
@@ -113,16 +187,16 @@ class BeepSatSimulator:
         trend = -0.025 * elapsed_hours
         
         # Normal noise
-        noise = random.uniform(-self.battery_noise, self.battery_noise)
+        noise = self._uniform(-self.battery_noise, self.battery_noise)
         
         # Occasional voltage spikes (solar panel reconnection, etc.)
-        if random.random() < self.anomaly_probability:
-            noise += random.uniform(0.3, 0.8)  # Positive spike
+        if self._random() < self.anomaly_probability:
+            noise += self._uniform(0.3, 0.8)  # Positive spike
             self.last_anomaly_time = current_time
         
         # Occasional voltage drops (high current draw)
-        elif random.random() < self.anomaly_probability * 0.5:
-            noise -= random.uniform(0.2, 0.5)  # Negative spike
+        elif self._random() < self.anomaly_probability * 0.5:
+            noise -= self._uniform(0.2, 0.5)  # Negative spike
             self.last_anomaly_time = current_time
         
         voltage = self.battery_base + trend + noise
@@ -131,19 +205,18 @@ class BeepSatSimulator:
     def get_rssi(self, current_time):
         """Calculate radio signal strength with realistic fading"""
         # Simulate orbital mechanics affecting signal
-        orbital_period = 300  # 5 minute "orbit" for demo
-        orbital_phase = (current_time % orbital_period) / orbital_period * 2 * np.pi
-        orbital_effect = 8 * np.sin(orbital_phase)  # ±8 dBm variation
+        phase_index = int((current_time % ORBITAL_PERIOD) * 2) % ORBITAL_SAMPLES
+        orbital_effect = self.orbital_table[phase_index]
         
         # Random fading
-        fading = random.uniform(-self.rssi_variation, self.rssi_variation)
+        fading = self._uniform(-self.rssi_variation, self.rssi_variation)
         
         # Occasional deep fades or signal boosts
-        if random.random() < self.anomaly_probability:
-            if random.random() < 0.5:
-                fading -= random.uniform(15, 25)  # Deep fade
+        if self._random() < self.anomaly_probability:
+            if self._random() < 0.5:
+                fading -= self._uniform(15, 25)  # Deep fade
             else:
-                fading += random.uniform(10, 20)  # Signal boost
+                fading += self._uniform(10, 20)  # Signal boost
             self.last_anomaly_time = current_time
         
         rssi = self.rssi_base + orbital_effect + fading
@@ -158,11 +231,11 @@ class BeepSatSimulator:
         current_time = time.time()
         
         # Occasionally increment error count
-        if random.random() < 0.0008:
+        if self._random() < 0.0008:
             self.state_errors += 1
         
         # Occasionally increment GS responses
-        if random.random() < 0.003:
+        if self._random() < 0.003:
             self.gs_responses += 1
         
         battery_v = self.get_battery_voltage(current_time)
@@ -180,16 +253,16 @@ class BeepSatSimulator:
             'nvm_counters': {
                 'boot_count': self.boot_count,
                 'state_errors': self.state_errors,
-                'vbus_resets': random.randint(0, 4),
+                'vbus_resets': int(self._random() * 5),
                 'gs_responses': self.gs_responses,
                 'charge_cycles': self.charge_cycles
             },
             'nvm_flags': {
                 'low_battery': battery_v < 6.0,
                 'solar_active': True,
-                'gps_on': random.random() < 0.15,
+                'gps_on': self._random() < 0.15,
                 'low_battery_timeout': battery_v < 5.8,
-                'gps_fix': random.random() < 0.4,
+                'gps_fix': self._random() < 0.4,
                 'shutdown': False
             },
             'radio_status': {
@@ -201,7 +274,7 @@ class BeepSatSimulator:
                 'battery_voltage': battery_v,
                 'low_battery_threshold': 6.0,
                 'uptime_seconds': self.get_uptime(current_time),
-                'charge_current': random.uniform(0.0, 0.9) if random.random() < 0.7 else 0.0
+                'charge_current': self._uniform(0.0, 0.9) if self._random() < 0.7 else 0.0
             },
             'system_info': {
                 'active_tasks': len(self.tasks),
@@ -221,67 +294,250 @@ class BeepSatSimulator:
         self.battery_trend = 0.0
         self.last_anomaly_time = 0
 
+def _zscore_anomalies_numpy(values, mean, std, threshold):
+    """Return (count, max |z|, indices above threshold) using NumPy passes"""
+    z_scores = np.abs((values - mean) / std)
+    indices = np.flatnonzero(z_scores > threshold)
+    return len(indices), z_scores.max(), indices
+
+if njit is not None:
+    @njit(cache=True)
+    def _zscore_anomalies(values, mean, std, threshold):
+        """Return (count, max |z|, indices above threshold) in a single pass"""
+        indices = np.empty(values.shape[0], dtype=np.int64)
+        count = 0
+        max_z = 0.0
+        for i in range(values.shape[0]):
+            z = abs((values[i] - mean) / std)
+            if z > max_z:
+                max_z = z
+            if z > threshold:
+                indices[count] = i
+                count += 1
+        return count, max_z, indices[:count]
+else:
+    _zscore_anomalies = _zscore_anomalies_numpy
+
+# Scales the MAD to match the standard deviation of normally distributed data
+MAD_SCALE = 1.4826
+
+def _mad_anomalies_numpy(values, median, threshold):
+    """Return (count, max robust |z|, indices above threshold) around the median"""
+    deviations = np.abs(values - median)
+    mad = MAD_SCALE * np.median(deviations)
+    if mad == 0:
+        return 0, 0.0, np.empty(0, dtype=np.int64)
+    robust_z = deviations / mad
+    indices = np.flatnonzero(robust_z > threshold)
+    return len(indices), robust_z.max(), indices
+
+if njit is not None:
+    @njit(cache=True)
+    def _mad_anomalies(values, median, threshold):
+        """Return (count, max robust |z|, indices above threshold) around the median"""
+        n = values.shape[0]
+        deviations = np.empty(n)
+        for i in range(n):
+            deviations[i] = abs(values[i] - median)
+        mad = MAD_SCALE * np.median(deviations)
+        indices = np.empty(n, dtype=np.int64)
+        if mad == 0:
+            return 0, 0.0, indices[:0]
+        count = 0
+        max_z = 0.0
+        for i in range(n):
+            z = deviations[i] / mad
+            if z > max_z:
+                max_z = z
+            if z > threshold:
+                indices[count] = i
+                count += 1
+        return count, max_z, indices[:count]
+else:
+    _mad_anomalies = _mad_anomalies_numpy
+
+class RunningStats:
+    """Welford running mean/variance over a sliding window of values"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget every value in the window"""
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def push(self, x):
+        """Add a value entering the window"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+    
+    def pop(self, x):
+        """Remove a value leaving the window"""
+        if self.n <= 1:
+            self.reset()
+            return
+        delta = x - self.mean
+        self.n -= 1
+        self.mean -= delta / self.n
+        self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+    
+    @property
+    def variance(self):
+        """Population variance, matching np.var"""
+        return self.m2 / self.n if self.n else 0.0
+    
+    @property
+    def std(self):
+        """Population standard deviation, matching np.std"""
+        return self.variance ** 0.5
+
+# Health checks as (stats source, field, sign, threshold, penalty, alert). Source
+# indexes (battery, rssi, error); sign +1 fails above the threshold, -1 below it.
+HEALTH_CHECKS = (
+    # Battery health checks
+    (0, 'mean', -1, 6.5, 20, "⚠️ Low average battery voltage"),
+    (0, 'anomaly_percentage', 1, 10, 15, "⚠️ High battery voltage anomalies"),
+    (0, 'trend_slope', -1, -0.001, 10, "📉 Battery voltage declining"),
+    # Radio health checks
+    (1, 'mean', -1, -70, 15, "📡 Weak average signal strength"),
+    (1, 'anomaly_percentage', 1, 15, 10, "📡 Signal instability detected"),
+    # Error rate checks
+    (2, 'trend_slope', 1, 0.001, 25, "🚨 Error rate increasing"),
+    (2, 'max_rate_of_change', 1, 2, 15, "🚨 Error spikes detected"),
+)
+HEALTH_CHECK_FIELDS = tuple((check[0], check[1]) for check in HEALTH_CHECKS)
+HEALTH_CHECK_SIGNS = np.array([check[2] for check in HEALTH_CHECKS], dtype=np.float64)
+HEALTH_CHECK_THRESHOLDS = np.array([check[3] for check in HEALTH_CHECKS], dtype=np.float64)
+HEALTH_CHECK_PENALTIES = np.array([check[4] for check in HEALTH_CHECKS])
+HEALTH_CHECK_ALERTS = tuple(check[5] for check in HEALTH_CHECKS)
+
 class StatisticalAnalyzer:
     """Statistical analysis engine for telemetry data"""
     
     def __init__(self):
         self.anomaly_threshold_multiplier = 2.5  # For anomaly detection
+        self.robust_threshold = 3.0  # Robust z (MAD units) for windows of robust_min_count+
+        self.robust_min_count = 20
+        self.cache = {}  # metric_name -> (window key, stats_dict)
+        self.normality_interval = 20  # Re-run Shapiro-Wilk every N new windows
+        self.normality = {}  # metric_name -> (windows since last test, result)
+        
+    def analyze_metric(self, values, metric_name="", running=None, last_timestamp=None):
+        """Comprehensive statistical analysis of a metric, memoized per data window
         
-    def analyze_metric(self, values, metric_name=""):
-        """Comprehensive statistical analysis of a metric"""
+        running is an optional RunningStats tracking the same window; when given,
+        mean/std/variance come from it instead of a pass over the values.
+        last_timestamp is the timestamp of the newest point in the window; it is
+        unique per packet, so it identifies the window even when the values repeat.
+        """
         if len(values) < 2:
             return None
-            
+        
+        # The window only changes when a packet is appended; without a timestamp
+        # there is nothing reliable to key on, so recompute
+        key = (len(values), last_timestamp)
+        if last_timestamp is None:
+            return self._compute_stats(values, running, metric_name)
+        cached = self.cache.get(metric_name)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        stats_dict = self._compute_stats(values, running, metric_name)
+        self.cache[metric_name] = (key, stats_dict)
+        return stats_dict
+    
+    def _normality(self, values_array, metric_name=""):
+        """Shapiro-Wilk result for the latest 50 points, refreshed every normality_interval windows"""
+        age, result = self.normality.get(metric_name, (self.normality_interval, {}))
+        if age < self.normality_interval:
+            self.normality[metric_name] = (age + 1, result)
+            return result
+        
+        # Normality test (Shapiro-Wilk for small samples)
+        try:
+            shapiro_stat, shapiro_p = stats.shapiro(values_array[-50:])  # Limit to 50 for performance
+            result = {
+                'normality_stat': shapiro_stat,
+                'normality_p_value': shapiro_p,
+                'is_normal': shapiro_p > 0.05
+            }
+        except:
+            result = {}
+        self.normality[metric_name] = (1, result)
+        return result
+    
+    def _compute_stats(self, values, running=None, metric_name=""):
+        """Run the full set of statistics over a window of values"""
         values_array = np.array(values)
         
+        if running is not None and running.n == len(values):
+            mean, std, variance = running.mean, running.std, running.variance
+        else:
+            mean, std, variance = np.mean(values_array), np.std(values_array), np.var(values_array)
+        
+        # One partition pass serves all three quartiles
+        q25, median, q75 = np.percentile(values_array, (25, 50, 75))
+        min_value, max_value = values_array.min(), values_array.max()
+        
         # Basic statistics
         stats_dict = {
             'count': len(values),
-            'mean': np.mean(values_array),
-            'median': np.median(values_array),
-            'std': np.std(values_array),
-            'variance': np.var(values_array),
-            'min': np.min(values_array),
-            'max': np.max(values_array),
-            'range': np.max(values_array) - np.min(values_array),
-            'q25': np.percentile(values_array, 25),
-            'q75': np.percentile(values_array, 75),
-            'iqr': np.percentile(values_array, 75) - np.percentile(values_array, 25)
+            'mean': mean,
+            'median': median,
+            'std': std,
+            'variance': variance,
+            'min': min_value,
+            'max': max_value,
+            'range': max_value - min_value,
+            'q25': q25,
+            'q75': q75,
+            'iqr': q75 - q25
         }
         
         # Trend analysis
         if len(values) > 3:
-            x = np.arange(len(values))
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, values_array)
+            # x is always 0..n-1, so the least-squares fit has a closed form
+            n = len(values)
+            x_centered = np.arange(n) - (n - 1) / 2
+            slope = np.dot(x_centered, values_array) / (n * (n * n - 1) / 12)
+            r_squared = 0.0
+            if variance > 0:
+                r_squared = min(slope * slope * (n * n - 1) / 12 / variance, 1.0)
             stats_dict.update({
                 'trend_slope': slope,
-                'trend_r_squared': r_value**2,
-                'trend_p_value': p_value
+                'trend_r_squared': r_squared,
+                'trend_p_value': np.nan  # Not used by the health assessment
             })
         
-        # Anomaly detection using z-score
-        if len(values) > 5 and stats_dict['std'] > 0:
-            z_scores = np.abs((values_array - stats_dict['mean']) / stats_dict['std'])
-            anomalies = z_scores > self.anomaly_threshold_multiplier
+        # Anomaly detection: median/MAD once the window is large enough, since
+        # injected spikes inflate the mean/std a z-score relies on
+        if len(values) >= self.robust_min_count:
+            anomaly_count, max_z_score, anomaly_indices = _mad_anomalies(
+                values_array.astype(np.float64), float(median), self.robust_threshold
+            )
+        elif len(values) > 5 and stats_dict['std'] > 0:
+            anomaly_count, max_z_score, anomaly_indices = _zscore_anomalies(
+                values_array.astype(np.float64), float(stats_dict['mean']),
+                float(stats_dict['std']), self.anomaly_threshold_multiplier
+            )
+        else:
+            anomaly_count = None
+        
+        if anomaly_count is not None:
             stats_dict.update({
-                'anomaly_count': np.sum(anomalies),
-                'anomaly_percentage': (np.sum(anomalies) / len(values)) * 100,
-                'max_z_score': np.max(z_scores),
-                'anomaly_indices': np.where(anomalies)[0].tolist()
+                'anomaly_count': anomaly_count,
+                'anomaly_percentage': (anomaly_count / len(values)) * 100,
+                'max_z_score': max_z_score,
+                'anomaly_indices': anomaly_indices.tolist()
             })
         
         # Distribution analysis
         if len(values) > 10:
-            # Normality test (Shapiro-Wilk for small samples)
-            try:
-                shapiro_stat, shapiro_p = stats.shapiro(values_array[:50])  # Limit to 50 for performance
-                stats_dict.update({
-                    'normality_stat': shapiro_stat,
-                    'normality_p_value': shapiro_p,
-                    'is_normal': shapiro_p > 0.05
-                })
-            except:
-                pass
+            stats_dict.update(self._normality(values_array, metric_name))
         
         # Stability metrics
         if len(values) > 1:
@@ -301,42 +557,17 @@ class StatisticalAnalyzer:
     
     def get_health_status(self, battery_stats, rssi_stats, error_stats):
         """Overall system health assessment"""
-        health_score = 100
-        alerts = []
+        sources = (battery_stats or {}, rssi_stats or {}, error_stats or {})
         
-        if battery_stats:
-            # Battery health checks
-            if battery_stats['mean'] < 6.5:
-                health_score -= 20
-                alerts.append("⚠️ Low average battery voltage")
-            
-            if battery_stats.get('anomaly_percentage', 0) > 10:
-                health_score -= 15
-                alerts.append("⚠️ High battery voltage anomalies")
-            
-            if battery_stats.get('trend_slope', 0) < -0.001:
-                health_score -= 10
-                alerts.append("📉 Battery voltage declining")
+        # Missing statistics read as NaN, which fails every comparison
+        values = np.array([
+            sources[source].get(field, np.nan) for source, field in HEALTH_CHECK_FIELDS
+        ], dtype=np.float64)
+        with np.errstate(invalid='ignore'):
+            failed = HEALTH_CHECK_SIGNS * (values - HEALTH_CHECK_THRESHOLDS) > 0
         
-        if rssi_stats:
-            # Radio health checks
-            if rssi_stats['mean'] < -70:
-                health_score -= 15
-                alerts.append("📡 Weak average signal strength")
-            
-            if rssi_stats.get('anomaly_percentage', 0) > 15:
-                health_score -= 10
-                alerts.append("📡 Signal instability detected")
-        
-        if error_stats:
-            # Error rate checks
-            if error_stats.get('trend_slope', 0) > 0.001:
-                health_score -= 25
-                alerts.append("🚨 Error rate increasing")
-            
-            if error_stats.get('max_rate_of_change', 0) > 2:
-                health_score -= 15
-                alerts.append("🚨 Error spikes detected")
+        health_score = 100 - int(HEALTH_CHECK_PENALTIES[failed].sum())
+        alerts = [HEALTH_CHECK_ALERTS[i] for i in np.flatnonzero(failed)]
         
         # Determine health level
         if health_score >= 90:
@@ -364,8 +595,15 @@ def initialize_session_state():
     """Initialize all session state variables"""
     if 'monitoring' not in st.session_state:
         st.session_state.monitoring = False
-    if 'telemetry_data' not in st.session_state:
-        st.session_state.telemetry_data = deque(maxlen=200)
+    if 'telemetry_ring' not in st.session_state:
+        # One preallocated column per metric, written in circular order
+        st.session_state.telemetry_ring = {
+            field: np.zeros(TELEMETRY_WINDOW, dtype=RING_DTYPES[field]) for field in METRIC_FIELDS
+        }
+        st.session_state.ring_index = 0
+        st.session_state.telemetry_count = 0
+    if 'running_stats' not in st.session_state:
+        st.session_state.running_stats = {field: RunningStats() for field in ANALYZED_FIELDS}
     if 'current_data' not in st.session_state:
         st.session_state.current_data = {}
     if 'simulator' not in st.session_state:
@@ -376,30 +614,63 @@ def initialize_session_state():
         st.session_state.mission_start_time = None
     if 'log_messages' not in st.session_state:
         st.session_state.log_messages = deque(maxlen=50)
-    if 'last_telemetry_time' not in st.session_state:
-        st.session_state.last_telemetry_time = 0
+    if 'telemetry_packets' not in st.session_state:
+        st.session_state.telemetry_packets = deque(maxlen=TELEMETRY_WINDOW)
+    if 'producer_stop' not in st.session_state:
+        st.session_state.producer_stop = None
     if 'data_points_generated' not in st.session_state:
         st.session_state.data_points_generated = 0
+    if 'telemetry_fig' not in st.session_state:
+        st.session_state.telemetry_fig = None
+    if 'plots_dirty' not in st.session_state:
+        st.session_state.plots_dirty = True
+    if 'histogram_figs' not in st.session_state:
+        st.session_state.histogram_figs = {}
 
 def add_log_message(message):
     """Add message to mission log"""
     timestamp = datetime.now().strftime("%H:%M:%S")
     st.session_state.log_messages.append(f"[{timestamp}] {message}")
 
+def produce_telemetry(simulator, packets_ref, stop_event):
+    """Generate packets at the telemetry rate until stopped (runs in its own thread)
+    
+    Only the objects passed in are touched here; st.session_state belongs to the
+    script thread. deque.append is atomic, so the UI can drain packets without a lock.
+    The session's deque is held weakly: once a closed session is discarded the deque
+    goes with it, and the thread exits instead of producing for nobody.
+    """
+    while not stop_event.wait(TELEMETRY_PERIOD):
+        packets = packets_ref()
+        if packets is None:
+            return
+        packets.append(simulator.generate_telemetry())
+        del packets
+
 def start_monitoring():
     """Start mission monitoring"""
     if not st.session_state.monitoring:
         st.session_state.monitoring = True
         st.session_state.mission_start_time = time.time()
         st.session_state.simulator = BeepSatSimulator()
-        st.session_state.last_telemetry_time = time.time()
         st.session_state.data_points_generated = 0
+        
+        # Fresh handoff objects so a producer still winding down cannot leak packets in
+        st.session_state.telemetry_packets = deque(maxlen=TELEMETRY_WINDOW)
+        st.session_state.producer_stop = threading.Event()
+        threading.Thread(
+            target=produce_telemetry,
+            args=(st.session_state.simulator, weakref.ref(st.session_state.telemetry_packets),
+                  st.session_state.producer_stop),
+            daemon=True
+        ).start()
         add_log_message("🚀 Mission started - Enhanced monitoring active")
 
 def stop_monitoring():
     """Stop mission monitoring"""
     if st.session_state.monitoring:
         st.session_state.monitoring = False
+        st.session_state.producer_stop.set()
         add_log_message("🛑 Mission stopped")
 
 def reset_mission():
@@ -407,85 +678,95 @@ def reset_mission():
     if st.session_state.monitoring:
         stop_monitoring()
     
-    st.session_state.telemetry_data.clear()
+    st.session_state.ring_index = 0
+    st.session_state.telemetry_count = 0
+    for running in st.session_state.running_stats.values():
+        running.reset()
+    st.session_state.analyzer.cache.clear()
+    st.session_state.telemetry_fig = None
+    st.session_state.plots_dirty = True
     st.session_state.current_data = {}
     st.session_state.log_messages.clear()
     st.session_state.mission_start_time = None
-    st.session_state.last_telemetry_time = 0
+    st.session_state.telemetry_packets.clear()
     st.session_state.data_points_generated = 0
     st.session_state.simulator.reset()
     
     add_log_message("🔄 Mission data reset complete")
 
-def generate_telemetry_data():
-    """Generate telemetry data if monitoring is active"""
-    current_time = time.time()
+def consume_telemetry_data():
+    """Move packets from the producer thread into the telemetry ring"""
+    packets = st.session_state.telemetry_packets
+    if not packets:
+        return False
     
-    if (st.session_state.monitoring and 
-        current_time - st.session_state.last_telemetry_time >= 0.5):
+    ring = st.session_state.telemetry_ring
+    running_stats = st.session_state.running_stats
+    while packets:
+        telemetry = packets.popleft()
+        idx = st.session_state.ring_index
         
-        telemetry = st.session_state.simulator.generate_telemetry()
-        st.session_state.telemetry_data.append(telemetry)
-        st.session_state.current_data = telemetry
-        st.session_state.last_telemetry_time = current_time
-        st.session_state.data_points_generated += 1
+        # Once the ring is full the slot being overwritten leaves the window
+        if st.session_state.telemetry_count == TELEMETRY_WINDOW:
+            for field, running in running_stats.items():
+                running.pop(float(ring[field][idx]))
         
-        return True
+        for field, value in zip(METRIC_FIELDS, telemetry_row(telemetry)):
+            ring[field][idx] = value
+        
+        for field, running in running_stats.items():
+            running.push(float(ring[field][idx]))
+        st.session_state.ring_index = (idx + 1) % TELEMETRY_WINDOW
+        st.session_state.telemetry_count = min(
+            st.session_state.telemetry_count + 1, TELEMETRY_WINDOW
+        )
+        st.session_state.data_points_generated += 1
     
-    return False
+    st.session_state.current_data = telemetry
+    st.session_state.plots_dirty = True
+    return True
 
 def extract_metric_data():
-    """Extract time series data for analysis"""
-    if not st.session_state.telemetry_data:
-        return {}, {}, {}, {}
+    """Extract time series data for analysis, oldest point first"""
+    ring = st.session_state.telemetry_ring
+    count = st.session_state.telemetry_count
+    idx = st.session_state.ring_index
     
-    data_list = list(st.session_state.telemetry_data)
-    timestamps = []
-    battery_voltages = []
-    rssi_values = []
-    error_counts = []
-    uptime_values = []
-    
-    for data in data_list:
-        timestamps.append(data.get('timestamp', time.time()))
-        
-        power_status = data.get('power_status', {})
-        battery_voltages.append(power_status.get('battery_voltage', 0))
-        
-        radio_status = data.get('radio_status', {})
-        rssi_values.append(radio_status.get('last_rssi', -100))
-        
-        nvm_counters = data.get('nvm_counters', {})
-        error_counts.append(nvm_counters.get('state_errors', 0))
-        
-        uptime_values.append(power_status.get('uptime_seconds', 0))
+    # The summary and the plots both read the window; unroll it once per new point
+    key = (idx, count, st.session_state.data_points_generated)
+    cached = st.session_state.get('metric_window')
+    if cached and cached[0] == key:
+        return cached[1]
     
-    return {
-        'timestamps': timestamps,
-        'battery_voltages': battery_voltages,
-        'rssi_values': rssi_values,
-        'error_counts': error_counts,
-        'uptime_values': uptime_values
-    }
+    # Until the ring wraps the columns are already in order and can be sliced
+    if count < TELEMETRY_WINDOW or idx == 0:
+        metrics = {field: ring[field][:count] for field in METRIC_FIELDS}
+    else:
+        metrics = {field: np.roll(ring[field], -idx) for field in METRIC_FIELDS}
+    st.session_state.metric_window = (key, metrics)
+    return metrics
 
 def create_statistical_summary():
     """Create comprehensive statistical analysis display"""
-    if len(st.session_state.telemetry_data) < 5:
+    if st.session_state.telemetry_count < 5:
         st.info("📊 Statistical analysis will appear after collecting more data points (minimum 5)")
         return
     
     # Extract data
     metrics = extract_metric_data()
     
-    # Analyze each metric
+    # Analyze each metric (battery results are shared with the telemetry plots)
+    running_stats = st.session_state.running_stats
+    last_timestamp = metrics['timestamps'][-1]
     battery_stats = st.session_state.analyzer.analyze_metric(
-        metrics['battery_voltages'], "Battery Voltage"
+        metrics['battery_voltages'], "Battery Voltage", running_stats['battery_voltages'],
+        last_timestamp
     )
     rssi_stats = st.session_state.analyzer.analyze_metric(
-        metrics['rssi_values'], "RSSI"
+        metrics['rssi_values'], "RSSI", running_stats['rssi_values'], last_timestamp
     )
     error_stats = st.session_state.analyzer.analyze_metric(
-        metrics['error_counts'], "Error Count"
+        metrics['error_counts'], "Error Count", running_stats['error_counts'], last_timestamp
     )
     
     # System health assessment
@@ -522,6 +803,20 @@ def create_statistical_summary():
         if error_stats:
             display_metric_stats("Error Count", error_stats, "errors", metrics['error_counts'])
 
+def build_histogram_figure(metric_name, unit):
+    """Create a metric's distribution histogram; binning happens in the browser"""
+    fig = go.Figure(go.Histogram(x=[], nbinsx=20))
+    fig.update_layout(
+        title=f"{metric_name} Distribution",
+        xaxis_title=f'{metric_name} ({unit})',
+        yaxis_title='Frequency',
+        height=300,
+        plot_bgcolor='rgba(14, 17, 23, 0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white')
+    )
+    return fig
+
 def display_metric_stats(metric_name, stats, unit, values):
     """Display detailed statistics for a single metric"""
     col1, col2 = st.columns(2)
@@ -569,19 +864,12 @@ def display_metric_stats(metric_name, stats, unit, values):
     if len(values) > 10:
         st.markdown(f"#### 📊 {metric_name} Distribution")
         
-        # Create histogram
-        fig = px.histogram(
-            x=values, 
-            nbins=20,
-            title=f"{metric_name} Distribution",
-            labels={'x': f'{metric_name} ({unit})', 'y': 'Frequency'}
-        )
-        fig.update_layout(
-            height=300,
-            plot_bgcolor='rgba(14, 17, 23, 0.8)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white')
-        )
+        # Histogram figures persist per metric; only the sample array is swapped
+        figs = st.session_state.histogram_figs
+        if metric_name not in figs:
+            figs[metric_name] = build_histogram_figure(metric_name, unit)
+        fig = figs[metric_name]
+        fig.data[0].x = values
         st.plotly_chart(fig, use_container_width=True)
         
         # Normality test results
@@ -589,56 +877,38 @@ def display_metric_stats(metric_name, stats, unit, values):
             normality_status = "✅ Normal" if stats['is_normal'] else "❌ Non-normal"
             st.write(f"**Distribution:** {normality_status} (p={stats['normality_p_value']:.4f})")
 
-def create_telemetry_plots():
-    """Create enhanced real-time telemetry plots"""
-    if not st.session_state.telemetry_data:
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=("🔋 Battery Voltage", "📡 Radio Signal", "🚨 System Errors", "⏰ Uptime"),
-        )
-        fig.update_layout(height=600, showlegend=False, plot_bgcolor='rgba(14, 17, 23, 0.8)')
-        return fig
-    
-    metrics = extract_metric_data()
-    timestamps = [datetime.fromtimestamp(ts) for ts in metrics['timestamps']]
-    
-    # Create subplots
+def build_telemetry_figure():
+    """Create the telemetry subplots once; later refreshes only swap trace data"""
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=("🔋 Battery Voltage", "📡 Radio Signal Strength", "🚨 System Errors", "⏰ System Uptime"),
     )
     
     # Battery voltage with anomaly highlighting
-    battery_stats = st.session_state.analyzer.analyze_metric(metrics['battery_voltages'])
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=metrics['battery_voltages'],
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='Battery Voltage',
             line=dict(color='cyan', width=3),
             marker=dict(size=4, color='cyan')
         ), row=1, col=1
     )
-    
-    # Highlight anomalies if detected
-    if battery_stats and 'anomaly_indices' in battery_stats and battery_stats['anomaly_indices']:
-        anomaly_times = [timestamps[i] for i in battery_stats['anomaly_indices']]
-        anomaly_values = [metrics['battery_voltages'][i] for i in battery_stats['anomaly_indices']]
-        fig.add_trace(
-            go.Scatter(
-                x=anomaly_times, y=anomaly_values,
-                mode='markers',
-                name='Anomalies',
-                marker=dict(size=8, color='red', symbol='x')
-            ), row=1, col=1
-        )
+    fig.add_trace(
+        go.Scattergl(
+            x=[], y=[],
+            mode='markers',
+            name='Anomalies',
+            marker=dict(size=8, color='red', symbol='x')
+        ), row=1, col=1
+    )
     
     fig.add_hline(y=6.0, line_dash="dash", line_color="red", row=1, col=1)
     
     # RSSI plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=metrics['rssi_values'],
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='RSSI',
             line=dict(color='lime', width=3),
@@ -648,8 +918,8 @@ def create_telemetry_plots():
     
     # Error count plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=metrics['error_counts'],
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='Errors',
             line=dict(color='orange', width=3),
@@ -659,8 +929,8 @@ def create_telemetry_plots():
     
     # Uptime plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=metrics['uptime_values'],
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='Uptime',
             line=dict(color='magenta', width=3),
@@ -668,12 +938,13 @@ def create_telemetry_plots():
         ), row=2, col=2
     )
     
-    # Update layout
+    # Update layout; uirevision keeps zoom and pan across data refreshes
     fig.update_layout(
         height=600, showlegend=False,
         plot_bgcolor='rgba(14, 17, 23, 0.8)',
         paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12)
+        font=dict(color='white', size=12),
+        uirevision='telemetry'
     )
     
     # Update axes
@@ -688,71 +959,81 @@ def create_telemetry_plots():
     
     return fig
 
-def main():
-    """Main dashboard function with enhanced statistics"""
-    # Initialize session state
-    initialize_session_state()
+def create_telemetry_plots():
+    """Refresh the persistent telemetry figure with the current window"""
+    if st.session_state.telemetry_fig is None:
+        st.session_state.telemetry_fig = build_telemetry_figure()
+    fig = st.session_state.telemetry_fig
     
-    # Header
-    st.markdown("# 🛰️ BEEPSAT MISSION CONTROL DASHBOARD")
-    st.markdown("### Real-Time Monitoring with Statistical Analysis")
+    # Traces already hold the current window unless a packet arrived since the last draw
+    if not st.session_state.telemetry_count or not st.session_state.plots_dirty:
+        return fig
+    st.session_state.plots_dirty = False
     
-    # Generate new telemetry data
-    new_data_generated = generate_telemetry_data()
+    metrics = extract_metric_data()
+    timestamps = to_local_datetime64(metrics['timestamps'])
     
-    # Sidebar - Mission Control
-    with st.sidebar:
-        st.markdown("## 🎮 Mission Control")
-        
-        # Status and controls
-        if st.session_state.monitoring:
-            st.markdown('<p class="status-connected">● MISSION ACTIVE</p>', unsafe_allow_html=True)
-            if st.button("🛑 Stop Mission", type="secondary"):
-                stop_monitoring()
-                st.rerun()
-        else:
-            st.markdown('<p class="status-disconnected">● MISSION INACTIVE</p>', unsafe_allow_html=True)
-            if st.button("🚀 Start Mission", type="primary"):
-                start_monitoring()
-                st.rerun()
-        
-        # Mission timer
-        if st.session_state.mission_start_time and st.session_state.monitoring:
-            elapsed = time.time() - st.session_state.mission_start_time
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            st.markdown(f'<p class="mission-time">{hours:02d}:{minutes:02d}:{seconds:02d}</p>', 
-                       unsafe_allow_html=True)
-        else:
-            st.markdown('<p class="mission-time">00:00:00</p>', unsafe_allow_html=True)
-        
-        # Reset button
-        if st.button("🔄 Reset Mission"):
-            reset_mission()
-            st.rerun()
-        
-        st.markdown("---")
-        
-        # Statistics
-        st.markdown("## 📊 Mission Statistics")
-        st.metric("Data Points", len(st.session_state.telemetry_data))
-        st.metric("Total Generated", st.session_state.data_points_generated)
-        
-        if st.session_state.monitoring:
-            st.metric("Data Rate", "2.0 Hz")
-        else:
-            st.metric("Data Rate", "0.0 Hz")
-        
-        st.markdown("---")
-        
-        # Mission Log
-        st.markdown("## 📝 Mission Log")
-        if st.session_state.log_messages:
-            log_text = "\n".join(list(st.session_state.log_messages)[-8:])
-            st.text_area("Recent Events", log_text, height=180, disabled=True, key="mission_log")
+    battery_stats = st.session_state.analyzer.analyze_metric(
+        metrics['battery_voltages'], "Battery Voltage",
+        st.session_state.running_stats['battery_voltages'], metrics['timestamps'][-1]
+    )
+    anomaly_indices = []
+    if battery_stats and 'anomaly_indices' in battery_stats:
+        anomaly_indices = battery_stats['anomaly_indices']
+    
+    # Trace order matches build_telemetry_figure
+    battery, anomalies, rssi, errors, uptime = fig.data
+    with fig.batch_update():
+        battery.x, battery.y = timestamps, metrics['battery_voltages']
+        anomalies.x = timestamps[anomaly_indices]
+        anomalies.y = metrics['battery_voltages'][anomaly_indices]
+        rssi.x, rssi.y = timestamps, metrics['rssi_values']
+        errors.x, errors.y = timestamps, metrics['error_counts']
+        uptime.x, uptime.y = timestamps, metrics['uptime_values']
+    
+    return fig
+
+# Only tick while a mission is running; otherwise the panels redraw on interaction
+@st.fragment(run_every=REFRESH_INTERVAL if st.session_state.get('monitoring') else None)
+def mission_status_panel():
+    """Sidebar timer, counters and log, refreshed without rerunning the whole script"""
+    # Mission timer
+    if st.session_state.mission_start_time and st.session_state.monitoring:
+        elapsed = time.time() - st.session_state.mission_start_time
+        hours = int(elapsed // 3600)
+        minutes = int((elapsed % 3600) // 60)
+        seconds = int(elapsed % 60)
+        st.markdown(f'<p class="mission-time">{hours:02d}:{minutes:02d}:{seconds:02d}</p>', 
+                   unsafe_allow_html=True)
+    else:
+        st.markdown('<p class="mission-time">00:00:00</p>', unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Statistics
+    st.markdown("## 📊 Mission Statistics")
+    st.metric("Data Points", st.session_state.telemetry_count)
+    st.metric("Total Generated", st.session_state.data_points_generated)
+    
+    if st.session_state.monitoring:
+        st.metric("Data Rate", "2.0 Hz")
+    else:
+        st.metric("Data Rate", "0.0 Hz")
+    
+    st.markdown("---")
+    
+    # Mission Log
+    st.markdown("## 📝 Mission Log")
+    if st.session_state.log_messages:
+        log = st.session_state.log_messages
+        log_text = "\n".join(islice(log, max(len(log) - 8, 0), None))
+        st.text_area("Recent Events", log_text, height=180, disabled=True, key="mission_log")
+
+@st.fragment(run_every=REFRESH_INTERVAL if st.session_state.get('monitoring') else None)
+def telemetry_panel():
+    """Pull in new packets and redraw the telemetry, plots and statistics"""
+    consume_telemetry_data()
     
-    # Main content
     if st.session_state.current_data:
         # Current telemetry display
         st.markdown("## 📡 Current Telemetry Status")
@@ -801,10 +1082,41 @@ def main():
         # Show empty plots
         fig = create_telemetry_plots()
         st.plotly_chart(fig, use_container_width=True)
+
+def main():
+    """Main dashboard function with enhanced statistics"""
+    # Initialize session state
+    initialize_session_state()
+    
+    # Header
+    st.markdown("# 🛰️ BEEPSAT MISSION CONTROL DASHBOARD")
+    st.markdown("### Real-Time Monitoring with Statistical Analysis")
+    
+    # Main content; drawn before the sidebar so its counters see this run's drain
+    telemetry_panel()
     
-    # Auto-refresh
-    time.sleep(1)
-    st.rerun()
+    # Sidebar - Mission Control
+    with st.sidebar:
+        st.markdown("## 🎮 Mission Control")
+        
+        # Status and controls
+        if st.session_state.monitoring:
+            st.markdown('<p class="status-connected">● MISSION ACTIVE</p>', unsafe_allow_html=True)
+            if st.button("🛑 Stop Mission", type="secondary"):
+                stop_monitoring()
+                st.rerun()
+        else:
+            st.markdown('<p class="status-disconnected">● MISSION INACTIVE</p>', unsafe_allow_html=True)
+            if st.button("🚀 Start Mission", type="primary"):
+                start_monitoring()
+                st.rerun()
+        
+        # Reset button
+        if st.button("🔄 Reset Mission"):
+            reset_mission()
+            st.rerun()
+        
+        mission_status_panel()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,12 +7,16 @@ Runs both simulation and Streamlit dashboard without threading issues
 import streamlit as st
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import numpy as np
 import json
 import time
 import os
 import sys
 import random
+import threading
+import weakref
 from collections import deque
+from itertools import islice
 from datetime import datetime
 
 # Configure Streamlit page
@@ -57,11 +61,57 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Random words generated per refill of the simulator's random pool; each word
+# holds 63 bits, read either as one uniform float or as packed event fields
+RANDOM_POOL_SIZE = 4096
+RANDOM_BITS = 63
+RANDOM_SCALE = 2.0 ** -RANDOM_BITS
+
+# Per-packet events are decided together from 12-bit fields of a single word;
+# an event fires when its field falls below round(probability * 4096)
+EVENT_FIELD_BITS = 12
+EVENT_FIELD_MASK = (1 << EVENT_FIELD_BITS) - 1
+ERROR_EVENT_CUTOFF = round(0.001 * (1 << EVENT_FIELD_BITS))
+GPS_ON_CUTOFF = round(0.1 * (1 << EVENT_FIELD_BITS))
+GPS_FIX_CUTOFF = round(0.3 * (1 << EVENT_FIELD_BITS))
+
+# Telemetry history kept for the plots, one ring column per plotted series. Each
+# column is twice the window and every sample is written at idx and idx + window,
+# so the latest window is always one contiguous slice.
+TELEMETRY_WINDOW = 150
+METRIC_FIELDS = ('timestamps', 'battery_voltages', 'rssi_values', 'error_counts', 'uptime_values')
+
+# Ring column dtypes; epoch timestamps keep float64 for sub-second precision
+RING_DTYPES = {
+    'timestamps': np.float64,
+    'battery_voltages': np.float32,
+    'rssi_values': np.int16,
+    'error_counts': np.uint32,
+    'uptime_values': np.float32
+}
+
+# Mission log entries shown in the sidebar
+LOG_TAIL_LINES = 8
+
+# Seconds between packets from the background telemetry producer (2 Hz)
+TELEMETRY_PERIOD = 0.5
+
+# Refresh cadence of the live panels while a mission is running (matches the 2 Hz data rate)
+REFRESH_INTERVAL = "0.5s"
+
 class BeepSatSimulator:
     """Thread-safe BeepSat simulator"""
     
+    __slots__ = (
+        'start_time', 'last_update', 'battery_base', 'battery_noise', 'battery_trend',
+        'state_errors', 'tasks',
+        'task_states', 'rssi_base', 'rssi_variation', 'metric_row',
+        'rng', 'random_pool', 'pool_index'
+    )
+    
     def __init__(self):
-        self.start_time = time.time()
+        # Elapsed-time math runs on the monotonic clock; packets carry wall-clock stamps
+        self.start_time = time.monotonic()
         self.last_update = time.time()
         
         # Simulation parameters
@@ -70,140 +120,251 @@ class BeepSatSimulator:
         self.battery_trend = 0.0
         
         # Counters
-        self.boot_count = random.randint(15, 45)
         self.state_errors = random.randint(1, 8)
-        self.gs_responses = random.randint(5, 30)
-        self.charge_cycles = random.randint(25, 90)
         
         # Tasks
         self.tasks = ['beacon', 'monitor', 'blink', 'vbatt', 'time', 'imu']
         
+        # Task states are shared by every packet; only last_seen changes per tick
+        self.task_states = {
+            task: {
+                'running': True,
+                'last_seen': 0.0
+            } for task in self.tasks
+        }
+        
         # RSSI simulation
         self.rssi_base = -55
         self.rssi_variation = 12
         
-    def get_battery_voltage(self, current_time):
+        # Flat (timestamp, battery, rssi, errors, uptime) of the latest packet
+        self.metric_row = None
+        
+        # Per-tick randomness is drawn from a pre-generated batch
+        self.rng = np.random.default_rng()
+        self.random_pool = self._draw_pool()
+        self.pool_index = 0
+        
+    def _draw_pool(self):
+        """A fresh batch of 63-bit random words as Python ints"""
+        return self.rng.integers(0, 1 << RANDOM_BITS, RANDOM_POOL_SIZE, dtype=np.int64).tolist()
+    
+    def _random_bits(self):
+        """Next 63-bit random word from the pool, refilling it when exhausted"""
+        if self.pool_index == RANDOM_POOL_SIZE:
+            self.random_pool = self._draw_pool()
+            self.pool_index = 0
+        value = self.random_pool[self.pool_index]
+        self.pool_index += 1
+        return value
+    
+    def _random(self):
+        """Next uniform draw in [0, 1) from the pool"""
+        return self._random_bits() * RANDOM_SCALE
+    
+    def _uniform(self, low, high):
+        """Uniform draw in [low, high) from the pool"""
+        return low + (high - low) * self._random()
+    
+    def _randint(self, low, high):
+        """Integer draw in [low, high], inclusive like random.randint"""
+        return low + int(self._random() * (high - low + 1))
+    
+    def get_battery_voltage(self, now):
         """Calculate realistic battery voltage"""
         # Slow discharge over time
-        elapsed_hours = (current_time - self.start_time) / 3600
+        elapsed_hours = (now - self.start_time) / 3600
         trend = -0.03 * elapsed_hours  # Slower discharge
         
         # Add realistic noise
-        noise = random.uniform(-self.battery_noise, self.battery_noise)
+        noise = self._uniform(-self.battery_noise, self.battery_noise)
         
         # Calculate voltage
         voltage = self.battery_base + trend + noise
         
-        # Ensure reasonable bounds
-        return max(min(voltage, 8.0), 5.8)
+        # Ensure reasonable bounds (comparisons, not two builtin calls per tick)
+        if voltage > 8.0:
+            return 8.0
+        if voltage < 5.8:
+            return 5.8
+        return voltage
     
     def get_rssi(self):
         """Calculate radio signal strength"""
-        return self.rssi_base + random.randint(-self.rssi_variation, self.rssi_variation)
+        return self.rssi_base + self._randint(-self.rssi_variation, self.rssi_variation)
     
-    def get_uptime(self, current_time):
-        """Get current uptime"""
-        return current_time - self.start_time
+    def get_uptime(self, now):
+        """Get current uptime from a time.monotonic() reading"""
+        return now - self.start_time
     
     def generate_telemetry(self):
         """Generate complete telemetry packet"""
         current_time = time.time()
+        now = time.monotonic()
+        
+        # One word decides every per-packet event, one 12-bit field each
+        events = self._random_bits()
         
         # Occasionally increment error count (every ~30 seconds on average)
-        if random.random() < 0.001:
+        if (events & EVENT_FIELD_MASK) < ERROR_EVENT_CUTOFF:
             self.state_errors += 1
         
-        # Occasionally increment GS responses
-        if random.random() < 0.005:
-            self.gs_responses += 1
+        battery_v = self.get_battery_voltage(now)
+        rssi = self.get_rssi()
+        uptime = self.get_uptime(now)
         
-        battery_v = self.get_battery_voltage(current_time)
+        for task_state in self.task_states.values():
+            task_state['last_seen'] = current_time
         
+        # Only the fields the dashboard displays; constants and counters nothing
+        # reads are left out rather than rebuilt every tick
         telemetry = {
             'timestamp': current_time,
-            'uptime': self.get_uptime(current_time),
-            'task_states': {
-                task: {
-                    'running': True,
-                    'last_seen': current_time
-                } for task in self.tasks
-            },
+            'task_states': self.task_states,
             'nvm_counters': {
-                'boot_count': self.boot_count,
-                'state_errors': self.state_errors,
-                'vbus_resets': random.randint(0, 4),
-                'gs_responses': self.gs_responses,
-                'charge_cycles': self.charge_cycles
+                'state_errors': self.state_errors
             },
             'nvm_flags': {
                 'low_battery': battery_v < 6.0,
                 'solar_active': True,
-                'gps_on': random.random() < 0.1,  # Occasionally turn on GPS
+                'gps_on': (events >> EVENT_FIELD_BITS & EVENT_FIELD_MASK) < GPS_ON_CUTOFF,  # Occasionally turn on GPS
                 'low_battery_timeout': battery_v < 5.8,
-                'gps_fix': random.random() < 0.3,
+                'gps_fix': (events >> 2 * EVENT_FIELD_BITS & EVENT_FIELD_MASK) < GPS_FIX_CUTOFF,
                 'shutdown': False
             },
             'radio_status': {
-                'last_rssi': self.get_rssi(),
-                'frequency': 433.0,
-                'available': True
+                'last_rssi': rssi
             },
             'power_status': {
                 'battery_voltage': battery_v,
-                'low_battery_threshold': 6.0,
-                'uptime_seconds': self.get_uptime(current_time),
-                'charge_current': random.uniform(0.0, 0.7) if random.random() < 0.6 else 0.0
+                'uptime_seconds': uptime
             },
             'system_info': {
-                'active_tasks': len(self.tasks),
-                'monitoring_frequency': 2,
-                'version': 'fixed_dashboard'
+                'active_tasks': len(self.tasks)
             }
         }
         
+        # Plotted values, flattened once in METRIC_FIELDS order for the ring
+        self.metric_row = (current_time, battery_v, rssi, self.state_errors, uptime)
+        
         self.last_update = current_time
         return telemetry
+
+class TelemetryFeed:
+    """One simulator and producer thread shared by every monitoring session
     
-    def reset(self):
-        """Reset simulation state"""
-        self.start_time = time.time()
-        self.state_errors = random.randint(0, 3)
-        self.gs_responses = random.randint(0, 10)
-        self.battery_trend = 0.0
+    Each session subscribes its own packet deque. The producer thread only touches
+    those deques, never st.session_state, and deque.append is atomic, so sessions
+    drain their packets without a lock. Subscribers are held weakly: a deque whose
+    session has been discarded drops out on its own.
+    
+    Each mission gets its own simulator and stop event. When the last viewer leaves,
+    the mission is stopped on the spot, so a Start right after a Reset always begins
+    a fresh mission instead of reattaching to a thread that has not noticed yet.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = []
+        self.thread = None
+        self.stop_event = None
+    
+    def subscribe(self):
+        """Start receiving (packet, metric row) pairs; returns the session's deque"""
+        packets = deque(maxlen=TELEMETRY_WINDOW)
+        with self.lock:
+            self.subscribers.append(weakref.ref(packets))
+            if self.thread is None:
+                # First viewer of an idle feed starts a fresh mission
+                self.stop_event = threading.Event()
+                self.thread = threading.Thread(
+                    target=self._produce, args=(BeepSatSimulator(), self.stop_event), daemon=True
+                )
+                self.thread.start()
+        return packets
+    
+    def unsubscribe(self, packets):
+        """Stop delivering packets to a session's deque, ending the mission if it was the last"""
+        with self.lock:
+            self.subscribers = [ref for ref in self.subscribers if ref() is not packets]
+            if not self.subscribers:
+                self._stop_locked()
+    
+    def _stop_locked(self):
+        """End the current mission; the caller holds the lock"""
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread = None
+            self.stop_event = None
+    
+    def _produce(self, simulator, stop_event):
+        """Generate packets at the telemetry rate until this mission is stopped"""
+        while not stop_event.wait(TELEMETRY_PERIOD):
+            with self.lock:
+                # Checked under the lock so a stopped mission never feeds a new subscriber
+                if stop_event.is_set():
+                    return
+                self.subscribers = [ref for ref in self.subscribers if ref() is not None]
+                if not self.subscribers:
+                    self._stop_locked()
+                    return
+                targets = [ref() for ref in self.subscribers]
+            
+            telemetry = simulator.generate_telemetry()
+            item = (telemetry, simulator.metric_row)
+            for packets in targets:
+                if packets is not None:
+                    packets.append(item)
+
+@st.cache_resource
+def get_telemetry_feed():
+    """The process-wide telemetry feed"""
+    return TelemetryFeed()
 
 # Initialize session state
 def initialize_session_state():
     """Initialize all session state variables"""
     if 'monitoring' not in st.session_state:
         st.session_state.monitoring = False
-    if 'telemetry_data' not in st.session_state:
-        st.session_state.telemetry_data = deque(maxlen=150)
+    if 'telemetry_ring' not in st.session_state:
+        # One preallocated column per metric, written in circular order
+        st.session_state.telemetry_ring = {
+            field: np.zeros(2 * TELEMETRY_WINDOW, dtype=RING_DTYPES[field]) for field in METRIC_FIELDS
+        }
+        st.session_state.ring_index = 0
+        st.session_state.telemetry_count = 0
     if 'current_data' not in st.session_state:
         st.session_state.current_data = {}
-    if 'simulator' not in st.session_state:
-        st.session_state.simulator = BeepSatSimulator()
     if 'mission_start_time' not in st.session_state:
         st.session_state.mission_start_time = None
     if 'log_messages' not in st.session_state:
         st.session_state.log_messages = deque(maxlen=50)
-    if 'last_telemetry_time' not in st.session_state:
-        st.session_state.last_telemetry_time = 0
+        st.session_state.log_tail = ""
+    if 'telemetry_packets' not in st.session_state:
+        st.session_state.telemetry_packets = deque(maxlen=TELEMETRY_WINDOW)
     if 'data_points_generated' not in st.session_state:
         st.session_state.data_points_generated = 0
+    if 'telemetry_fig' not in st.session_state:
+        st.session_state.telemetry_fig = None
 
 def add_log_message(message):
     """Add message to mission log"""
     timestamp = datetime.now().strftime("%H:%M:%S")
-    st.session_state.log_messages.append(f"[{timestamp}] {message}")
+    log = st.session_state.log_messages
+    log.append(f"[{timestamp}] {message}")
+    
+    # The sidebar text only changes here, so join its lines once per message
+    st.session_state.log_tail = "\n".join(islice(log, max(len(log) - LOG_TAIL_LINES, 0), None))
 
 def start_monitoring():
     """Start mission monitoring"""
     if not st.session_state.monitoring:
         st.session_state.monitoring = True
-        st.session_state.mission_start_time = time.time()
-        st.session_state.simulator = BeepSatSimulator()  # Fresh simulator
-        st.session_state.last_telemetry_time = time.time()
+        st.session_state.mission_start_time = time.monotonic()
         st.session_state.data_points_generated = 0
+        
+        # Join the shared feed with a fresh deque
+        st.session_state.telemetry_packets = get_telemetry_feed().subscribe()
         add_log_message("🚀 Mission started - BeepSat simulation active")
         add_log_message("📡 Telemetry generation started")
 
@@ -211,6 +372,7 @@ def stop_monitoring():
     """Stop mission monitoring"""
     if st.session_state.monitoring:
         st.session_state.monitoring = False
+        get_telemetry_feed().unsubscribe(st.session_state.telemetry_packets)
         add_log_message("🛑 Mission stopped")
 
 def reset_mission():
@@ -220,79 +382,62 @@ def reset_mission():
         stop_monitoring()
     
     # Clear data
-    st.session_state.telemetry_data.clear()
+    st.session_state.ring_index = 0
+    st.session_state.telemetry_count = 0
+    st.session_state.telemetry_fig = None
     st.session_state.current_data = {}
     st.session_state.log_messages.clear()
+    st.session_state.log_tail = ""
     st.session_state.mission_start_time = None
-    st.session_state.last_telemetry_time = 0
+    st.session_state.telemetry_packets.clear()
     st.session_state.data_points_generated = 0
     
-    # Reset simulator
-    st.session_state.simulator.reset()
-    
     add_log_message("🔄 Mission data reset complete")
 
-def generate_telemetry_data():
-    """Generate telemetry data if monitoring is active"""
-    current_time = time.time()
+def consume_telemetry_data():
+    """Move packets from the producer thread into the telemetry ring"""
+    packets = st.session_state.telemetry_packets
+    if not packets:
+        return False
     
-    # Generate data every 0.5 seconds (2Hz)
-    if (st.session_state.monitoring and 
-        current_time - st.session_state.last_telemetry_time >= 0.5):
-        
-        # Generate new telemetry
-        telemetry = st.session_state.simulator.generate_telemetry()
+    ring = st.session_state.telemetry_ring
+    while packets:
+        telemetry, row = packets.popleft()
         
         # Add to data storage
-        st.session_state.telemetry_data.append(telemetry)
-        st.session_state.current_data = telemetry
-        st.session_state.last_telemetry_time = current_time
+        idx = st.session_state.ring_index
+        slots = [idx, idx + TELEMETRY_WINDOW]
+        for field, value in zip(METRIC_FIELDS, row):
+            ring[field][slots] = value
+        st.session_state.ring_index = (idx + 1) % TELEMETRY_WINDOW
+        st.session_state.telemetry_count = min(
+            st.session_state.telemetry_count + 1, TELEMETRY_WINDOW
+        )
         st.session_state.data_points_generated += 1
-        
-        return True
     
-    return False
+    st.session_state.current_data = telemetry
+    return True
 
-def create_telemetry_plots():
-    """Create real-time telemetry plots"""
-    if not st.session_state.telemetry_data:
-        # Empty plots
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=("🔋 Battery Voltage", "📡 Radio Signal", "🚨 System Errors", "⏰ Uptime"),
-        )
-        fig.update_layout(
-            height=600, 
-            showlegend=False, 
-            plot_bgcolor='rgba(14, 17, 23, 0.8)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white')
-        )
-        return fig
-    
-    # Extract data for plotting
-    data_list = list(st.session_state.telemetry_data)
-    timestamps = []
-    battery_voltages = []
-    rssi_values = []
-    error_counts = []
-    uptime_values = []
+def to_local_datetime64(timestamps):
+    """Convert epoch seconds to local-time datetime64 values for plotting"""
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    return ((timestamps + offset) * 1000).astype('datetime64[ms]')
+
+def extract_metric_data():
+    """Time series for each plotted metric, oldest point first, as zero-copy views"""
+    ring = st.session_state.telemetry_ring
+    count = st.session_state.telemetry_count
     
-    for data in data_list:
-        timestamps.append(datetime.fromtimestamp(data.get('timestamp', time.time())))
-        
-        power_status = data.get('power_status', {})
-        battery_voltages.append(power_status.get('battery_voltage', 0))
-        
-        radio_status = data.get('radio_status', {})
-        rssi_values.append(radio_status.get('last_rssi', -100))
-        
-        nvm_counters = data.get('nvm_counters', {})
-        error_counts.append(nvm_counters.get('state_errors', 0))
-        
-        uptime_values.append(power_status.get('uptime_seconds', 0))
+    # Until the ring wraps the columns are already in order from the start
+    if count < TELEMETRY_WINDOW:
+        return {field: ring[field][:count] for field in METRIC_FIELDS}
     
-    # Create subplots
+    # Once full, the oldest sample sits at the write index and its mirror follows
+    idx = st.session_state.ring_index
+    return {field: ring[field][idx:idx + TELEMETRY_WINDOW] for field in METRIC_FIELDS}
+
+def build_telemetry_figure():
+    """Create the telemetry subplots once; later refreshes only swap trace data"""
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=("🔋 Battery Voltage", "📡 Radio Signal Strength", "🚨 System Errors", "⏰ System Uptime"),
@@ -300,8 +445,8 @@ def create_telemetry_plots():
     
     # Battery voltage plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=battery_voltages,
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='Battery Voltage',
             line=dict(color='cyan', width=3),
@@ -313,8 +458,8 @@ def create_telemetry_plots():
     
     # RSSI plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=rssi_values,
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='RSSI',
             line=dict(color='lime', width=3),
@@ -324,8 +469,8 @@ def create_telemetry_plots():
     
     # Error count plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=error_counts,
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='Errors',
             line=dict(color='orange', width=3),
@@ -335,8 +480,8 @@ def create_telemetry_plots():
     
     # Uptime plot
     fig.add_trace(
-        go.Scatter(
-            x=timestamps, y=uptime_values,
+        go.Scattergl(
+            x=[], y=[],
             mode='lines+markers',
             name='Uptime',
             line=dict(color='magenta', width=3),
@@ -344,13 +489,14 @@ def create_telemetry_plots():
         ), row=2, col=2
     )
     
-    # Update layout
+    # Update layout; uirevision keeps zoom and pan across data refreshes
     fig.update_layout(
         height=600,
         showlegend=False,
         plot_bgcolor='rgba(14, 17, 23, 0.8)',
         paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12)
+        font=dict(color='white', size=12),
+        uirevision='telemetry'
     )
     
     # Update axes styling
@@ -365,74 +511,78 @@ def create_telemetry_plots():
     
     return fig
 
-def main():
-    """Main dashboard function"""
-    # Initialize session state
-    initialize_session_state()
+def create_telemetry_plots(new_data=True):
+    """Refresh the persistent telemetry figure with the buffered data
     
-    # Header
-    st.markdown("# 🛰️ BEEPSAT MISSION CONTROL DASHBOARD")
-    st.markdown("### Real-Time Satellite Monitoring & Simulation")
+    When no packet arrived since the last draw the traces are left as they are.
+    """
+    if st.session_state.telemetry_fig is None:
+        st.session_state.telemetry_fig = build_telemetry_figure()
+    fig = st.session_state.telemetry_fig
     
-    # Generate new telemetry data
-    new_data_generated = generate_telemetry_data()
+    if not st.session_state.telemetry_count:
+        return fig
+    if not new_data and len(fig.data[0].x):
+        return fig
     
-    # Sidebar - Mission Control
-    with st.sidebar:
-        st.markdown("## 🎮 Mission Control")
-        
-        # Status display
-        if st.session_state.monitoring:
-            st.markdown('<p class="status-connected">● MISSION ACTIVE</p>', unsafe_allow_html=True)
-            if st.button("🛑 Stop Mission", type="secondary"):
-                stop_monitoring()
-                st.rerun()
-        else:
-            st.markdown('<p class="status-disconnected">● MISSION INACTIVE</p>', unsafe_allow_html=True)
-            if st.button("🚀 Start Mission", type="primary"):
-                start_monitoring()
-                st.rerun()
-        
-        # Mission timer
-        if st.session_state.mission_start_time and st.session_state.monitoring:
-            elapsed = time.time() - st.session_state.mission_start_time
-            hours = int(elapsed // 3600)
-            minutes = int((elapsed % 3600) // 60)
-            seconds = int(elapsed % 60)
-            st.markdown(f'<p class="mission-time">{hours:02d}:{minutes:02d}:{seconds:02d}</p>', 
-                       unsafe_allow_html=True)
-        else:
-            st.markdown('<p class="mission-time">00:00:00</p>', unsafe_allow_html=True)
-        
-        # Reset button
-        if st.button("🔄 Reset Mission"):
-            reset_mission()
-            st.rerun()
-        
-        st.markdown("---")
-        
-        # Statistics
-        st.markdown("## 📊 Mission Statistics")
-        st.metric("Data Points", len(st.session_state.telemetry_data))
-        st.metric("Total Generated", st.session_state.data_points_generated)
-        
-        if st.session_state.monitoring:
-            data_rate = 2.0  # We generate at 2Hz
-            st.metric("Data Rate", f"{data_rate:.1f} Hz")
-        else:
-            st.metric("Data Rate", "0.0 Hz")
-        
-        st.markdown("---")
-        
-        # Mission Log
-        st.markdown("## 📝 Mission Log")
-        if st.session_state.log_messages:
-            log_text = "\n".join(list(st.session_state.log_messages)[-8:])
-            st.text_area("Recent Events", log_text, height=200, disabled=True, key="mission_log")
-        else:
-            st.info("No mission events yet")
+    # Extract data for plotting
+    metrics = extract_metric_data()
+    timestamps = to_local_datetime64(metrics['timestamps'])
+    
+    # Trace order matches build_telemetry_figure
+    battery, rssi, errors, uptime = fig.data
+    with fig.batch_update():
+        battery.x, battery.y = timestamps, metrics['battery_voltages']
+        rssi.x, rssi.y = timestamps, metrics['rssi_values']
+        errors.x, errors.y = timestamps, metrics['error_counts']
+        uptime.x, uptime.y = timestamps, metrics['uptime_values']
+    
+    return fig
+
+# Only tick while a mission is running; otherwise the panels redraw on interaction
+@st.fragment(run_every=REFRESH_INTERVAL if st.session_state.get('monitoring') else None)
+def mission_status_panel():
+    """Sidebar timer, counters and log, refreshed without rerunning the whole script"""
+    # Mission timer
+    if st.session_state.mission_start_time and st.session_state.monitoring:
+        elapsed = time.monotonic() - st.session_state.mission_start_time
+        hours = int(elapsed // 3600)
+        minutes = int((elapsed % 3600) // 60)
+        seconds = int(elapsed % 60)
+        st.markdown(f'<p class="mission-time">{hours:02d}:{minutes:02d}:{seconds:02d}</p>', 
+                   unsafe_allow_html=True)
+    else:
+        st.markdown('<p class="mission-time">00:00:00</p>', unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Statistics
+    st.markdown("## 📊 Mission Statistics")
+    st.metric("Data Points", st.session_state.telemetry_count)
+    st.metric("Total Generated", st.session_state.data_points_generated)
+    
+    if st.session_state.monitoring:
+        data_rate = 2.0  # We generate at 2Hz
+        st.metric("Data Rate", f"{data_rate:.1f} Hz")
+    else:
+        st.metric("Data Rate", "0.0 Hz")
+    
+    st.markdown("---")
+    
+    # Mission Log
+    st.markdown("## 📝 Mission Log")
+    if st.session_state.log_messages:
+        # A plain code block, not a disabled widget, so no widget state rides along
+        st.caption("Recent Events")
+        st.code(st.session_state.log_tail, language=None)
+    else:
+        st.info("No mission events yet")
+
+@st.fragment(run_every=REFRESH_INTERVAL if st.session_state.get('monitoring') else None)
+def telemetry_panel():
+    """Pull in new packets and redraw the telemetry metrics and plots"""
+    new_data = consume_telemetry_data()
     
-    # Main content area
     if st.session_state.current_data:
         # Current telemetry display
         st.markdown("## 📡 Current Telemetry Status")
@@ -470,7 +620,7 @@ def main():
         
         # Real-time plots
         st.markdown("## 📈 Real-Time Telemetry Graphs")
-        fig = create_telemetry_plots()
+        fig = create_telemetry_plots(new_data)
         st.plotly_chart(fig, use_container_width=True)
         
         # Additional system information
@@ -504,12 +654,43 @@ def main():
         st.write("- ⏳ Waiting for mission start")
         
         # Show empty plots
-        fig = create_telemetry_plots()
+        fig = create_telemetry_plots(new_data)
         st.plotly_chart(fig, use_container_width=True)
+
+def main():
+    """Main dashboard function"""
+    # Initialize session state
+    initialize_session_state()
+    
+    # Header
+    st.markdown("# 🛰️ BEEPSAT MISSION CONTROL DASHBOARD")
+    st.markdown("### Real-Time Satellite Monitoring & Simulation")
+    
+    # Sidebar - Mission Control
+    with st.sidebar:
+        st.markdown("## 🎮 Mission Control")
+        
+        # Status display
+        if st.session_state.monitoring:
+            st.markdown('<p class="status-connected">● MISSION ACTIVE</p>', unsafe_allow_html=True)
+            if st.button("🛑 Stop Mission", type="secondary"):
+                stop_monitoring()
+                st.rerun()
+        else:
+            st.markdown('<p class="status-disconnected">● MISSION INACTIVE</p>', unsafe_allow_html=True)
+            if st.button("🚀 Start Mission", type="primary"):
+                start_monitoring()
+                st.rerun()
+        
+        # Reset button
+        if st.button("🔄 Reset Mission"):
+            reset_mission()
+            st.rerun()
+        
+        mission_status_panel()
     
-    # Auto-refresh every 1 second
-    time.sleep(1)
-    st.rerun()
+    # Main content area
+    telemetry_panel()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,27 +9,73 @@ from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.animation import FuncAnimation
-import json
+import numpy as np
+import orjson
 import time
 import threading
-import queue
-from collections import deque
+from collections import deque, namedtuple
 import sys
 import subprocess
 import serial
 import re
 
+# Telemetry history kept for the plots, one ring column per plotted series
+TELEMETRY_WINDOW = 100
+METRIC_FIELDS = ('timestamps', 'battery_voltages', 'rssi_values', 'error_counts', 'uptime_values')
+
+# Initial plot limits. Axes keep fixed limits so animation frames can be blitted;
+# an axis is only rescaled (one full redraw) when data leaves its range.
+PLOT_HISTORY_SECONDS = 60  # TELEMETRY_WINDOW packets at 2 Hz span 50 s
+PLOT_Y_LIMITS = {
+    'battery_voltages': (5.0, 9.0),
+    'rssi_values': (-100.0, 0.0),
+    'error_counts': (0.0, 10.0),
+    'uptime_values': (0.0, 1000.0)
+}
+
+# Upper bound on one bulk read from the serial port
+SERIAL_READ_SIZE = 4096
+
+# Seconds between simulated console packets (2 Hz)
+TELEMETRY_PERIOD = 0.5
+
+# Most packets handled per 100 ms processing tick, so a backlog cannot stall Tk
+DRAIN_BATCH_SIZE = 64
+
+# Fields the dashboard reads from each packet, unpacked once by the receiver thread
+TelemetryPacket = namedtuple(
+    'TelemetryPacket', ['timestamp', 'battery_voltage', 'rssi', 'state_errors', 'uptime', 'active_tasks']
+)
+
+def extract_telemetry_packet(data):
+    """Flatten a nested telemetry dict into the fields the dashboard displays"""
+    # Serial packets may omit sections, so every field keeps its default
+    power_status = data.get('power_status', {})
+    return TelemetryPacket(
+        timestamp=data.get('timestamp', time.time()),
+        battery_voltage=power_status.get('battery_voltage', 0),
+        rssi=data.get('radio_status', {}).get('last_rssi', -100),
+        state_errors=data.get('nvm_counters', {}).get('state_errors', 0),
+        uptime=power_status.get('uptime_seconds', 0),
+        active_tasks=data.get('system_info', {}).get('active_tasks', 0)
+    )
+
 class TelemetryReceiver:
     """Handles receiving telemetry from various sources"""
     
-    def __init__(self, data_queue):
-        self.data_queue = data_queue
+    def __init__(self):
+        # Each receiver owns its bounded handoff deque, so concurrent sources never
+        # share one; deque append/popleft are atomic, so the receiver thread and the
+        # UI need no lock
+        self.packets = deque(maxlen=TELEMETRY_WINDOW)
         self.running = False
         self.thread = None
+        self.stop_event = threading.Event()
         
     def start_console_monitoring(self):
         """Monitor console output for telemetry"""
         self.running = True
+        self.stop_event.clear()
         self.thread = threading.Thread(target=self._monitor_console, daemon=True)
         self.thread.start()
         
@@ -48,6 +94,7 @@ class TelemetryReceiver:
     def _monitor_console(self):
         """Monitor stdout for telemetry patterns"""
         # This would be enhanced to read from a subprocess running the satellite
+        next_tick = time.monotonic()
         while self.running:
             # Simulate receiving telemetry for demonstration
             sample_data = {
@@ -70,31 +117,60 @@ class TelemetryReceiver:
                     'active_tasks': 5
                 }
             }
-            self.data_queue.put(sample_data)
-            time.sleep(0.5)  # 2Hz simulation
+            self.packets.append(extract_telemetry_packet(sample_data))
+            
+            # 2Hz simulation on a monotonic deadline so the cadence does not drift;
+            # after a stall the schedule restarts from now instead of bursting
+            next_tick += TELEMETRY_PERIOD
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                next_tick -= delay
+                delay = 0
+            
+            # The wait doubles as the stop signal, so stop() wakes the thread at once
+            if self.stop_event.wait(delay):
+                break
             
     def _monitor_serial(self):
         """Monitor serial port for telemetry"""
+        pending = bytearray()
         while self.running:
             try:
-                line = self.serial_port.readline().decode('utf-8').strip()
-                if 'TELEMETRY_OUTPUT:' in line or 'TELEM:' in line:
-                    # Extract JSON from telemetry line
-                    json_start = line.find('{')
-                    if json_start != -1:
-                        json_data = line[json_start:]
-                        try:
-                            data = json.loads(json_data)
-                            self.data_queue.put(data)
-                        except json.JSONDecodeError as e:
-                            print(f"JSON decode error: {e}")
+                # Read whatever has arrived in one call (blocking up to the port timeout
+                # for the first byte) instead of readline()'s byte-at-a-time loop
+                waiting = self.serial_port.in_waiting
+                pending += self.serial_port.read(min(waiting, SERIAL_READ_SIZE) if waiting else 1)
+                
+                # Hand over complete lines, keeping any partial line for the next read
+                end = pending.rfind(b'\n')
+                if end == -1:
+                    continue
+                lines = bytes(pending[:end]).split(b'\n')
+                del pending[:end + 1]
+                for line in lines:
+                    self._handle_serial_line(line)
             except Exception as e:
                 print(f"Serial monitoring error: {e}")
                 time.sleep(1)
     
+    def _handle_serial_line(self, line):
+        """Queue the telemetry packet carried by one raw serial line, if any"""
+        # Raw bytes: ordinary log lines are rejected without a UTF-8 decode
+        if b'TELEMETRY_OUTPUT:' in line or b'TELEM:' in line:
+            # Extract JSON from telemetry line
+            json_start = line.find(b'{')
+            if json_start != -1:
+                json_data = line[json_start:]
+                try:
+                    data = orjson.loads(json_data)
+                    self.packets.append(extract_telemetry_packet(data))
+                except orjson.JSONDecodeError as e:
+                    print(f"JSON decode error: {e}")
+    
     def stop(self):
         """Stop monitoring"""
         self.running = False
+        self.stop_event.set()
         if hasattr(self, 'serial_port'):
             self.serial_port.close()
 
@@ -106,19 +182,15 @@ class BeepSatDashboard:
         self.root.title("BeepSat Ground Station Dashboard")
         self.root.geometry("1200x800")
         
-        # Data storage
-        self.data_queue = queue.Queue()
-        self.telemetry_history = deque(maxlen=200)
+        # Telemetry receivers, one per source, each with its own packet deque
+        self.console_receiver = TelemetryReceiver()
+        self.serial_receiver = TelemetryReceiver()
+        self.receivers = (self.console_receiver, self.serial_receiver)
         
-        # Telemetry receiver
-        self.receiver = TelemetryReceiver(self.data_queue)
-        
-        # Data for plots
-        self.timestamps = deque(maxlen=100)
-        self.battery_voltages = deque(maxlen=100)
-        self.rssi_values = deque(maxlen=100)
-        self.error_counts = deque(maxlen=100)
-        self.uptime_values = deque(maxlen=100)
+        # Data for plots: one preallocated column per metric, written in circular order
+        self.telemetry_ring = {field: np.zeros(TELEMETRY_WINDOW) for field in METRIC_FIELDS}
+        self.ring_index = 0
+        self.telemetry_count = 0
         
         self.setup_ui()
         self.setup_plots()
@@ -203,117 +275,147 @@ class BeepSatDashboard:
         self.ax4.grid(True, alpha=0.3)
         self.uptime_line, = self.ax4.plot([], [], 'm-', linewidth=2)
         
+        # Each line with its axes and ring column
+        self.plot_series = (
+            (self.ax1, self.battery_line, 'battery_voltages'),
+            (self.ax2, self.rssi_line, 'rssi_values'),
+            (self.ax3, self.error_line, 'error_counts'),
+            (self.ax4, self.uptime_line, 'uptime_values')
+        )
+        self.plot_lines = tuple(line for _, line, _ in self.plot_series)
+        
+        # Fixed limits and labels, set once instead of autoscaled every frame
+        for ax, _, field in self.plot_series:
+            ax.set_xlim(-PLOT_HISTORY_SECONDS, 0)
+            ax.set_ylim(*PLOT_Y_LIMITS[field])
+            ax.set_xlabel('Time (seconds ago)')
+        
         # Embed plots in tkinter
         self.canvas = FigureCanvasTkAgg(self.fig, self.plots_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-        # Setup animation
-        self.animation = FuncAnimation(self.fig, self.update_plots, interval=500, blit=False)
+        # Setup animation; blitting restores each cached axes background and
+        # redraws only the lines
+        self.animation = FuncAnimation(self.fig, self.update_plots, interval=500, blit=True)
         
     def start_console_monitoring(self):
         """Start console monitoring"""
-        self.receiver.start_console_monitoring()
+        self.console_receiver.start_console_monitoring()
         self.status_var.set("Monitoring Console")
         
     def start_serial_monitoring(self):
         """Start serial monitoring"""
-        if self.receiver.start_serial_monitoring():
+        if self.serial_receiver.start_serial_monitoring():
             self.status_var.set("Monitoring Serial")
         else:
             self.status_var.set("Serial Failed")
             
     def stop_monitoring(self):
         """Stop all monitoring"""
-        self.receiver.stop()
+        for receiver in self.receivers:
+            receiver.stop()
         self.status_var.set("Stopped")
         
     def process_data(self):
         """Process incoming telemetry data"""
-        try:
-            while not self.data_queue.empty():
-                data = self.data_queue.get_nowait()
-                self.telemetry_history.append(data)
+        data = None
+        budget = DRAIN_BATCH_SIZE
+        
+        # Bind the ring columns and position once; they are written back after the drain
+        ring = self.telemetry_ring
+        timestamps = ring['timestamps']
+        battery_voltages = ring['battery_voltages']
+        rssi_values = ring['rssi_values']
+        error_counts = ring['error_counts']
+        uptime_values = ring['uptime_values']
+        idx = self.ring_index
+        
+        # Drain each receiver's deque in turn; as its single consumer, the packets
+        # counted here cannot be taken by anyone else
+        for receiver in self.receivers:
+            popleft = receiver.packets.popleft
+            take = min(len(receiver.packets), budget)
+            budget -= take
+            for _ in range(take):
+                data = popleft()
                 
                 # Extract values for plotting
-                timestamp = data.get('timestamp', time.time())
-                self.timestamps.append(timestamp)
-                
-                # Battery voltage
-                power_status = data.get('power_status', {})
-                battery_v = power_status.get('battery_voltage', 0)
-                self.battery_voltages.append(battery_v)
-                
-                # RSSI
-                radio_status = data.get('radio_status', {})
-                rssi = radio_status.get('last_rssi', -100)
-                if rssi is not None:
-                    self.rssi_values.append(rssi)
-                else:
-                    self.rssi_values.append(-100)
-                
-                # Error count
-                nvm_counters = data.get('nvm_counters', {})
-                errors = nvm_counters.get('state_errors', 0)
-                self.error_counts.append(errors)
-                
-                # Uptime
-                uptime = power_status.get('uptime_seconds', 0)
-                self.uptime_values.append(uptime)
-                
-                # Update current value labels
-                self.battery_label.config(text=f"Battery: {battery_v:.2f} V")
-                self.rssi_label.config(text=f"RSSI: {rssi} dBm")
-                self.uptime_label.config(text=f"Uptime: {uptime:.1f} s")
-                
-                system_info = data.get('system_info', {})
-                active_tasks = system_info.get('active_tasks', 0)
-                self.tasks_label.config(text=f"Tasks: {active_tasks}")
-                
-        except queue.Empty:
-            pass
+                timestamps[idx] = data.timestamp
+                battery_voltages[idx] = data.battery_voltage
+                rssi_values[idx] = data.rssi if data.rssi is not None else -100
+                error_counts[idx] = data.state_errors
+                uptime_values[idx] = data.uptime
+                idx = (idx + 1) % TELEMETRY_WINDOW
+        
+        if data is not None:
+            drained = DRAIN_BATCH_SIZE - budget
+            self.ring_index = idx
+            self.telemetry_count = min(self.telemetry_count + drained, TELEMETRY_WINDOW)
+            
+            # Update current value labels once per batch, from the latest packet
+            self.battery_label.config(text=f"Battery: {data.battery_voltage:.2f} V")
+            self.rssi_label.config(text=f"RSSI: {data.rssi} dBm")
+            self.uptime_label.config(text=f"Uptime: {data.uptime:.1f} s")
+            self.tasks_label.config(text=f"Tasks: {data.active_tasks}")
         
         # Schedule next data processing
         self.root.after(100, self.process_data)
         
+    def extract_metric_data(self):
+        """Time series for each plotted metric, oldest point first"""
+        ring = self.telemetry_ring
+        count = self.telemetry_count
+        idx = self.ring_index
+        
+        # Until the ring wraps the columns are already in order and can be sliced
+        if count < TELEMETRY_WINDOW or idx == 0:
+            return {field: ring[field][:count] for field in METRIC_FIELDS}
+        return {field: np.concatenate((ring[field][idx:], ring[field][:idx])) for field in METRIC_FIELDS}
+        
     def update_plots(self, frame):
-        """Update plot data"""
-        if len(self.timestamps) < 2:
-            return
+        """Update plot data; returns the line artists for blitting"""
+        if self.telemetry_count < 2:
+            return self.plot_lines
             
+        metrics = self.extract_metric_data()
+        
         # Convert timestamps to relative time for better visualization
         current_time = time.time()
-        relative_times = [(t - current_time) for t in self.timestamps]
-        
-        # Update battery voltage plot
-        self.battery_line.set_data(relative_times, self.battery_voltages)
-        self.ax1.relim()
-        self.ax1.autoscale_view()
-        
-        # Update RSSI plot
-        self.rssi_line.set_data(relative_times, self.rssi_values)
-        self.ax2.relim()
-        self.ax2.autoscale_view()
-        
-        # Update error count plot
-        self.error_line.set_data(relative_times, self.error_counts)
-        self.ax3.relim()
-        self.ax3.autoscale_view()
-        
-        # Update uptime plot
-        self.uptime_line.set_data(relative_times, self.uptime_values)
-        self.ax4.relim()
-        self.ax4.autoscale_view()
-        
-        # Adjust x-axis labels to show relative time
-        for ax in [self.ax1, self.ax2, self.ax3, self.ax4]:
-            ax.set_xlabel('Time (seconds ago)')
+        relative_times = metrics['timestamps'] - current_time
+        
+        rescaled = False
+        for ax, line, field in self.plot_series:
+            values = metrics[field]
+            line.set_data(relative_times, values)
+            
+            # Widen an axis only when data falls outside its current limits
+            x_low, _ = ax.get_xlim()
+            if relative_times[0] < x_low:
+                ax.set_xlim(1.2 * relative_times[0], 0)
+                rescaled = True
+            y_low, y_high = ax.get_ylim()
+            v_min, v_max = values.min(), values.max()
+            if v_min < y_low or v_max > y_high:
+                low, high = min(y_low, v_min), max(y_high, v_max)
+                margin = 0.1 * (high - low)
+                ax.set_ylim(low - margin if v_min < y_low else low,
+                            high + margin if v_max > y_high else high)
+                rescaled = True
+        
+        # New limits need fresh ticks and grid; the full draw leaves out the animated
+        # lines, so the animation re-caches clean backgrounds for the next frames
+        if rescaled:
+            self.canvas.draw()
+        
+        return self.plot_lines
             
     def run(self):
         """Run the dashboard test"""
         try:
             self.root.mainloop()
         finally:
-            self.receiver.stop()
+            for receiver in self.receivers:
+                receiver.stop()
 
 if __name__ == "__main__":
     dashboard = BeepSatDashboard()
@@ -5,16 +5,16 @@ Runs both simulation and Streamlit dashboard in one script
 """
 
 import streamlit as st
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
 import time
 import threading
-import queue
 import os
 import sys
 import re
-from collections import deque
+from collections import deque, namedtuple
 from datetime import datetime
 import random
 
@@ -63,6 +63,29 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Per-tick random samples are pre-generated in batches of this many packets
+RANDOM_BATCH_SIZE = 1024
+
+# Telemetry history kept for the plots, one ring column per plotted series
+TELEMETRY_WINDOW = 100
+METRIC_FIELDS = ('timestamps', 'battery_voltages', 'rssi_values', 'error_counts', 'uptime_values')
+
+# Points drawn for the battery and RSSI traces; longer windows are downsampled
+# with LTTB at render time. The error and uptime step traces keep every point
+PLOT_MAX_POINTS = 60
+DOWNSAMPLED_FIELDS = ('battery_voltages', 'rssi_values')
+
+# Fields the dashboard reads from each packet, unpacked once by the producer thread
+TelemetryPacket = namedtuple(
+    'TelemetryPacket', ['timestamp', 'battery_voltage', 'rssi', 'state_errors', 'uptime', 'active_tasks']
+)
+
+# Seconds between packets from the background telemetry producer (2 Hz)
+TELEMETRY_PERIOD = 0.5
+
+# Refresh cadence of the live panels while a mission is running
+REFRESH_INTERVAL = "1s"
+
 class IntegratedBeepSatSimulator:
     """Integrated BeepSat simulator that runs directly in the dashboard"""
     
@@ -92,12 +115,55 @@ class IntegratedBeepSatSimulator:
             'shutdown': False
         }
         
+        # Packets share one read-only copy of the flags, re-taken only after a change
+        self.flags_snapshot = self.flags.copy()
+        self.flags_dirty = False
+        
         # Tasks
         self.tasks = ['beacon', 'monitor', 'blink', 'vbatt', 'time', 'imu']
         
+        # Task states are shared by every packet; only last_seen changes per tick
+        self.task_states = {
+            task: {
+                'running': True,
+                'last_seen': 0.0
+            } for task in self.tasks
+        }
+        
         # RSSI simulation
         self.rssi_base = -55
         self.rssi_variation = 15
+        
+        # Batched randomness: one list per sampled quantity, one entry per packet
+        self.rng = np.random.default_rng()
+        self.random_batch = self._draw_batch()
+        self.batch_index = -1  # advanced before each packet
+    
+    def _draw_batch(self):
+        """Pre-generate RANDOM_BATCH_SIZE packets' worth of random samples"""
+        rng = self.rng
+        n = RANDOM_BATCH_SIZE
+        charging = rng.random(n) < 0.7
+        return {
+            'battery_noise': rng.uniform(-self.battery_noise, self.battery_noise, n).tolist(),
+            'rssi_offset': rng.integers(-self.rssi_variation, self.rssi_variation, n, endpoint=True).tolist(),
+            'error_event': (rng.random(n) < 0.001).tolist(),  # 0.1% chance per packet
+            'vbus_resets': rng.integers(0, 3, n, endpoint=True).tolist(),
+            'charge_current': np.where(charging, rng.uniform(0.0, 0.8, n), 0.0).tolist()
+        }
+    
+    def _set_flag(self, name, value):
+        """Update a flag, marking the packet snapshot stale only when it changes"""
+        if self.flags[name] != value:
+            self.flags[name] = value
+            self.flags_dirty = True
+    
+    def _advance_batch(self):
+        """Move to the next packet's samples, refilling the batch when exhausted"""
+        self.batch_index += 1
+        if self.batch_index == RANDOM_BATCH_SIZE:
+            self.random_batch = self._draw_batch()
+            self.batch_index = 0
     
     @property
     def battery_voltage(self):
@@ -107,17 +173,17 @@ class IntegratedBeepSatSimulator:
         self.battery_trend = -0.05 * elapsed_hours
         
         # Add noise
-        voltage = self.battery_base + self.battery_trend + random.uniform(-self.battery_noise, self.battery_noise)
+        voltage = self.battery_base + self.battery_trend + self.random_batch['battery_noise'][self.batch_index]
         
         # Update low battery flag
-        self.flags['low_battery'] = voltage < 6.0
+        self._set_flag('low_battery', voltage < 6.0)
         
         return max(voltage, 5.5)  # Don't go below 5.5V
     
     @property
     def rssi(self):
         """Simulate radio signal strength"""
-        return self.rssi_base + random.randint(-self.rssi_variation, self.rssi_variation)
+        return self.rssi_base + self.random_batch['rssi_offset'][self.batch_index]
     
     @property
     def uptime(self):
@@ -129,28 +195,33 @@ class IntegratedBeepSatSimulator:
     def generate_telemetry(self):
         """Generate a complete telemetry packet"""
         current_time = time.time()
+        self._advance_batch()
+        batch = self.random_batch
+        i = self.batch_index
         
         # Occasionally increment error count
-        if random.random() < 0.001:  # 0.1% chance per call
+        if batch['error_event'][i]:
             self.state_errors += 1
         
+        for task_state in self.task_states.values():
+            task_state['last_seen'] = current_time
+        
+        if self.flags_dirty:
+            self.flags_snapshot = self.flags.copy()
+            self.flags_dirty = False
+        
         telemetry = {
             'timestamp': current_time,
             'uptime': self.uptime,
-            'task_states': {
-                task: {
-                    'running': True,
-                    'last_seen': current_time
-                } for task in self.tasks
-            },
+            'task_states': self.task_states,
             'nvm_counters': {
                 'boot_count': self.boot_count,
                 'state_errors': self.state_errors,
-                'vbus_resets': random.randint(0, 3),
+                'vbus_resets': batch['vbus_resets'][i],
                 'gs_responses': self.gs_responses,
                 'charge_cycles': self.charge_cycles
             },
-            'nvm_flags': self.flags.copy(),
+            'nvm_flags': self.flags_snapshot,
             'radio_status': {
                 'last_rssi': self.rssi,
                 'frequency': 433.0,
@@ -160,7 +231,7 @@ class IntegratedBeepSatSimulator:
                 'battery_voltage': self.battery_voltage,
                 'low_battery_threshold': 6.0,
                 'uptime_seconds': self.uptime,
-                'charge_current': random.uniform(0.0, 0.8) if random.random() < 0.7 else 0.0
+                'charge_current': batch['charge_current'][i]
             },
             'system_info': {
                 'active_tasks': len(self.tasks),
@@ -187,6 +258,62 @@ class IntegratedBeepSatSimulator:
         self.state_errors = random.randint(0, 2)
         self.gs_responses = random.randint(0, 5)
 
+def extract_telemetry_packet(telemetry):
+    """Flatten a nested telemetry dict into the fields the dashboard displays"""
+    power_status = telemetry['power_status']
+    return TelemetryPacket(
+        timestamp=telemetry['timestamp'],
+        battery_voltage=power_status['battery_voltage'],
+        rssi=telemetry['radio_status']['last_rssi'],
+        state_errors=telemetry['nvm_counters']['state_errors'],
+        uptime=power_status['uptime_seconds'],
+        active_tasks=telemetry['system_info']['active_tasks']
+    )
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps, in order
+    
+    The first and last points are always kept. The interior is split into
+    n_out - 2 buckets, and each bucket keeps the point forming the largest
+    triangle with the previously kept point and the next bucket's average.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # Bucket bounds and averages in one pass; each bucket is paired with the
+    # next one's average, and the last bucket with the final point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    sizes = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[:n - 1], edges[:-1])[1:] / sizes[1:], x[n - 1]).tolist()
+    avg_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1])[1:] / sizes[1:], y[n - 1]).tolist()
+    
+    # The selection is sequential (each pick anchors the next), and buckets hold a
+    # few points, so plain floats beat per-bucket array calls
+    xs = x.tolist()
+    ys = y.tolist()
+    bounds = edges.tolist()
+    indices = [0]
+    prev = 0
+    for b in range(n_out - 2):
+        px, py = xs[prev], ys[prev]
+        ax, ay = avg_x[b], avg_y[b]
+        best_area = -1.0
+        for i in range(bounds[b], bounds[b + 1]):
+            # Twice the triangle area; the factor does not change the maximum
+            area = abs((px - ax) * (ys[i] - py) - (px - xs[i]) * (ay - py))
+            if area > best_area:
+                best_area = area
+                prev = i
+        indices.append(prev)
+    indices.append(n - 1)
+    return np.array(indices)
+
+def to_local_datetime64(timestamps):
+    """Convert epoch seconds to local-time datetime64 values for plotting"""
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    return ((timestamps + offset) * 1000).astype('datetime64[ms]')
+
 class IntegratedDashboard:
     """Main dashboard with integrated simulation"""
     
@@ -194,10 +321,15 @@ class IntegratedDashboard:
         # Initialize session state
         if 'monitoring' not in st.session_state:
             st.session_state.monitoring = False
-        if 'telemetry_data' not in st.session_state:
-            st.session_state.telemetry_data = deque(maxlen=100)
+        if 'telemetry_ring' not in st.session_state:
+            # One preallocated column per metric, written in circular order
+            st.session_state.telemetry_ring = {
+                field: np.zeros(TELEMETRY_WINDOW) for field in METRIC_FIELDS
+            }
+            st.session_state.ring_index = 0
+            st.session_state.telemetry_count = 0
         if 'current_data' not in st.session_state:
-            st.session_state.current_data = {}
+            st.session_state.current_data = None
         if 'simulator' not in st.session_state:
             st.session_state.simulator = IntegratedBeepSatSimulator()
         if 'mission_start_time' not in st.session_state:
@@ -206,23 +338,46 @@ class IntegratedDashboard:
             st.session_state.log_messages = deque(maxlen=50)
         if 'data_generation_thread' not in st.session_state:
             st.session_state.data_generation_thread = None
+        if 'producer_stop' not in st.session_state:
+            st.session_state.producer_stop = threading.Event()
         if 'telemetry_queue' not in st.session_state:
-            st.session_state.telemetry_queue = queue.Queue()
+            # Bounded handoff from the producer thread; deque append/popleft are
+            # atomic, so the single producer and consumer need no lock
+            st.session_state.telemetry_queue = deque(maxlen=TELEMETRY_WINDOW)
+        if 'new_data_count' not in st.session_state:
+            st.session_state.new_data_count = 0
+        if 'telemetry_fig' not in st.session_state:
+            st.session_state.telemetry_fig = None
     
     def add_log_message(self, message):
         """Add message to mission log"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         st.session_state.log_messages.append(f"[{timestamp}] {message}")
     
-    def generate_telemetry_data(self):
-        """Background thread to generate telemetry data"""
-        while st.session_state.monitoring:
-            if st.session_state.simulator.running:
-                # Generate telemetry packet
-                telemetry = st.session_state.simulator.generate_telemetry()
-                st.session_state.telemetry_queue.put(telemetry)
+    def generate_telemetry_data(self, simulator, telemetry_queue, stop_event):
+        """Background thread to generate telemetry data
+        
+        Everything it needs is passed in; st.session_state is not reachable from a
+        thread without a script run context.
+        """
+        next_tick = time.monotonic()
+        while True:
+            if simulator.running:
+                # Generate telemetry packet, flattened before it reaches the UI
+                telemetry = simulator.generate_telemetry()
+                telemetry_queue.append(extract_telemetry_packet(telemetry))
+            
+            # Ticks follow a monotonic deadline so the 2Hz cadence does not drift;
+            # after a stall the schedule restarts from now instead of bursting
+            next_tick += TELEMETRY_PERIOD
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                next_tick -= delay
+                delay = 0
             
-            time.sleep(0.5)  # Generate data every 0.5 seconds (2Hz)
+            # The wait doubles as the stop signal, so stopping wakes the thread at once
+            if stop_event.wait(delay):
+                break
     
     def start_monitoring(self):
         """Start the mission monitoring"""
@@ -232,7 +387,13 @@ class IntegratedDashboard:
             st.session_state.simulator.start()
             
             # Start data generation thread
-            thread = threading.Thread(target=self.generate_telemetry_data, daemon=True)
+            st.session_state.producer_stop = threading.Event()
+            thread = threading.Thread(
+                target=self.generate_telemetry_data,
+                args=(st.session_state.simulator, st.session_state.telemetry_queue,
+                      st.session_state.producer_stop),
+                daemon=True
+            )
             thread.start()
             st.session_state.data_generation_thread = thread
             
@@ -243,6 +404,7 @@ class IntegratedDashboard:
         """Stop the mission monitoring"""
         if st.session_state.monitoring:
             st.session_state.monitoring = False
+            st.session_state.producer_stop.set()
             st.session_state.simulator.stop()
             
             self.add_log_message("🛑 Mission stopped")
@@ -254,13 +416,14 @@ class IntegratedDashboard:
             self.stop_monitoring()
         
         # Clear data
-        st.session_state.telemetry_data.clear()
-        st.session_state.current_data = {}
+        st.session_state.ring_index = 0
+        st.session_state.telemetry_count = 0
+        st.session_state.telemetry_fig = None
+        st.session_state.current_data = None
         st.session_state.log_messages.clear()
         
         # Clear queue
-        while not st.session_state.telemetry_queue.empty():
-            st.session_state.telemetry_queue.get()
+        st.session_state.telemetry_queue.clear()
         
         # Reset simulator
         st.session_state.simulator.reset()
@@ -271,50 +434,56 @@ class IntegratedDashboard:
     def process_telemetry_queue(self):
         """Process new telemetry data"""
         processed_count = 0
-        while not st.session_state.telemetry_queue.empty():
-            try:
-                data = st.session_state.telemetry_queue.get_nowait()
-                st.session_state.telemetry_data.append(data)
-                st.session_state.current_data = data
-                processed_count += 1
-            except queue.Empty:
-                break
-        return processed_count
-    
-    def create_telemetry_plots(self):
-        """Create real-time telemetry plots"""
-        if not st.session_state.telemetry_data:
-            # Empty plot
-            fig = make_subplots(
-                rows=2, cols=2,
-                subplot_titles=("🔋 Battery Voltage", "📡 Radio Signal", "🚨 System Errors", "⏰ Uptime"),
-            )
-            fig.update_layout(height=600, showlegend=False, plot_bgcolor='rgba(14, 17, 23, 0.8)')
-            return fig
+        data = None
         
-        # Extract data
-        data_list = list(st.session_state.telemetry_data)
-        timestamps = []
-        battery_voltages = []
-        rssi_values = []
-        error_counts = []
-        uptime_values = []
-        
-        for data in data_list:
-            timestamps.append(datetime.fromtimestamp(data.get('timestamp', time.time())))
-            
-            power_status = data.get('power_status', {})
-            battery_voltages.append(power_status.get('battery_voltage', 0))
-            
-            radio_status = data.get('radio_status', {})
-            rssi_values.append(radio_status.get('last_rssi', -100))
+        # Session state lookups go through a proxy; bind everything the loop
+        # touches once and write the ring position back after the drain
+        packets = st.session_state.telemetry_queue
+        popleft = packets.popleft
+        ring = st.session_state.telemetry_ring
+        timestamps = ring['timestamps']
+        battery_voltages = ring['battery_voltages']
+        rssi_values = ring['rssi_values']
+        error_counts = ring['error_counts']
+        uptime_values = ring['uptime_values']
+        idx = st.session_state.ring_index
+        
+        # Single consumer: a non-empty deque cannot be emptied under us
+        while packets:
+            data = popleft()
             
-            nvm_counters = data.get('nvm_counters', {})
-            error_counts.append(nvm_counters.get('state_errors', 0))
+            # Write the plotted scalars straight into the ring columns
+            timestamps[idx] = data.timestamp
+            battery_voltages[idx] = data.battery_voltage
+            rssi_values[idx] = data.rssi
+            error_counts[idx] = data.state_errors
+            uptime_values[idx] = data.uptime
+            idx = (idx + 1) % TELEMETRY_WINDOW
+            processed_count += 1
+        
+        if data is not None:
+            st.session_state.ring_index = idx
+            st.session_state.telemetry_count = min(
+                st.session_state.telemetry_count + processed_count, TELEMETRY_WINDOW
+            )
             
-            uptime_values.append(power_status.get('uptime_seconds', 0))
+            # Only the latest packet feeds the status panel
+            st.session_state.current_data = data
+        return processed_count
+    
+    def extract_metric_data(self):
+        """Time series for each plotted metric, oldest point first"""
+        ring = st.session_state.telemetry_ring
+        count = st.session_state.telemetry_count
+        idx = st.session_state.ring_index
         
-        # Create plots
+        # Until the ring wraps the columns are already in order and can be sliced
+        if count < TELEMETRY_WINDOW or idx == 0:
+            return {field: ring[field][:count] for field in METRIC_FIELDS}
+        return {field: np.concatenate((ring[field][idx:], ring[field][:idx])) for field in METRIC_FIELDS}
+    
+    def build_telemetry_figure(self):
+        """Create the telemetry subplots once; later refreshes only swap trace data"""
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=("🔋 Battery Voltage", "📡 Radio Signal Strength", "🚨 System Errors", "⏰ System Uptime"),
@@ -322,31 +491,32 @@ class IntegratedDashboard:
         
         # Battery voltage
         fig.add_trace(
-            go.Scatter(x=timestamps, y=battery_voltages, mode='lines+markers',
+            go.Scatter(x=[], y=[], mode='lines+markers',
                       name='Battery', line=dict(color='cyan', width=2)), row=1, col=1)
         fig.add_hline(y=6.0, line_dash="dash", line_color="red", row=1, col=1)
         
         # RSSI
         fig.add_trace(
-            go.Scatter(x=timestamps, y=rssi_values, mode='lines+markers',
+            go.Scatter(x=[], y=[], mode='lines+markers',
                       name='RSSI', line=dict(color='lime', width=2)), row=1, col=2)
         
         # Errors
         fig.add_trace(
-            go.Scatter(x=timestamps, y=error_counts, mode='lines+markers',
+            go.Scatter(x=[], y=[], mode='lines+markers',
                       name='Errors', line=dict(color='orange', width=2)), row=2, col=1)
         
         # Uptime
         fig.add_trace(
-            go.Scatter(x=timestamps, y=uptime_values, mode='lines+markers',
+            go.Scatter(x=[], y=[], mode='lines+markers',
                       name='Uptime', line=dict(color='magenta', width=2)), row=2, col=2)
         
-        # Update layout
+        # Update layout; uirevision keeps zoom and pan across data refreshes
         fig.update_layout(
             height=600, showlegend=False,
             plot_bgcolor='rgba(14, 17, 23, 0.8)',
             paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white', size=12)
+            font=dict(color='white', size=12),
+            uirevision='telemetry'
         )
         
         # Update axes
@@ -361,90 +531,91 @@ class IntegratedDashboard:
         
         return fig
     
-    def run(self):
-        """Main dashboard interface"""
-        # Header
-        st.markdown("# 🛰️ BEEPSAT MISSION CONTROL DASHBOARD")
-        st.markdown("### Integrated Simulation & Real-Time Monitoring")
+    def create_telemetry_plots(self):
+        """Refresh the persistent telemetry figure with the buffered data"""
+        if st.session_state.telemetry_fig is None:
+            st.session_state.telemetry_fig = self.build_telemetry_figure()
+        fig = st.session_state.telemetry_fig
         
-        # Process telemetry data
-        new_data_count = self.process_telemetry_queue()
+        if not st.session_state.telemetry_count:
+            return fig
         
-        # Sidebar - Mission Control
-        with st.sidebar:
-            st.markdown("## 🎮 Mission Control")
-            
-            # Status and controls
-            if st.session_state.monitoring:
-                st.markdown('<p class="status-connected">● MISSION ACTIVE</p>', unsafe_allow_html=True)
-                if st.button("🛑 Stop Mission", type="secondary"):
-                    self.stop_monitoring()
-            else:
-                st.markdown('<p class="status-disconnected">● MISSION INACTIVE</p>', unsafe_allow_html=True)
-                if st.button("🚀 Start Mission", type="primary"):
-                    self.start_monitoring()
-            
-            # Mission timer
-            if st.session_state.mission_start_time and st.session_state.monitoring:
-                elapsed = time.time() - st.session_state.mission_start_time
-                hours = int(elapsed // 3600)
-                minutes = int((elapsed % 3600) // 60)
-                seconds = int(elapsed % 60)
-                st.markdown(f'<p class="mission-time">{hours:02d}:{minutes:02d}:{seconds:02d}</p>', 
-                           unsafe_allow_html=True)
-            else:
-                st.markdown('<p class="mission-time">00:00:00</p>', unsafe_allow_html=True)
-            
-            # Reset button
-            if st.button("🔄 Reset Mission"):
-                self.reset_mission()
-                st.rerun()
-            
-            # Statistics
-            st.markdown("## 📊 Statistics")
-            st.metric("Data Points", len(st.session_state.telemetry_data))
-            st.metric("Queue Size", st.session_state.telemetry_queue.qsize())
-            if new_data_count > 0:
-                st.metric("Data Rate", f"{new_data_count * 2:.1f} Hz")
-            
-            # Mission Log
-            st.markdown("## 📝 Mission Log")
-            if st.session_state.log_messages:
-                log_text = "\n".join(list(st.session_state.log_messages)[-8:])
-                st.text_area("Recent Events", log_text, height=180, disabled=True)
+        # Extract data
+        metrics = self.extract_metric_data()
+        seconds = metrics['timestamps']
+        timestamps = to_local_datetime64(seconds)
+        
+        # Trace order matches build_telemetry_figure; the ring keeps full resolution
+        # and only what is sent to the browser is downsampled, per trace
+        traces = zip(fig.data, ('battery_voltages', 'rssi_values', 'error_counts', 'uptime_values'))
+        with fig.batch_update():
+            for trace, field in traces:
+                if field in DOWNSAMPLED_FIELDS:
+                    keep = lttb_indices(seconds, metrics[field], PLOT_MAX_POINTS)
+                    trace.x, trace.y = timestamps[keep], metrics[field][keep]
+                else:
+                    trace.x, trace.y = timestamps, metrics[field]
+        
+        return fig
+    
+    # Only tick while a mission is running; otherwise the panels redraw on interaction
+    @st.fragment(run_every=REFRESH_INTERVAL if st.session_state.get('monitoring') else None)
+    def mission_status_panel(self):
+        """Sidebar timer, statistics and log, refreshed without rerunning the whole script"""
+        # Mission timer
+        if st.session_state.mission_start_time and st.session_state.monitoring:
+            elapsed = time.time() - st.session_state.mission_start_time
+            hours = int(elapsed // 3600)
+            minutes = int((elapsed % 3600) // 60)
+            seconds = int(elapsed % 60)
+            st.markdown(f'<p class="mission-time">{hours:02d}:{minutes:02d}:{seconds:02d}</p>', 
+                       unsafe_allow_html=True)
+        else:
+            st.markdown('<p class="mission-time">00:00:00</p>', unsafe_allow_html=True)
+        
+        # Statistics
+        st.markdown("## 📊 Statistics")
+        st.metric("Data Points", st.session_state.telemetry_count)
+        st.metric("Queue Size", len(st.session_state.telemetry_queue))
+        new_data_count = st.session_state.new_data_count
+        if new_data_count > 0:
+            st.metric("Data Rate", f"{new_data_count * 2:.1f} Hz")
+        
+        # Mission Log
+        st.markdown("## 📝 Mission Log")
+        if st.session_state.log_messages:
+            log_text = "\n".join(list(st.session_state.log_messages)[-8:])
+            st.text_area("Recent Events", log_text, height=180, disabled=True)
+    
+    @st.fragment(run_every=REFRESH_INTERVAL if st.session_state.get('monitoring') else None)
+    def telemetry_panel(self):
+        """Drain new telemetry and redraw the metrics and plots"""
+        # Process telemetry data
+        st.session_state.new_data_count = self.process_telemetry_queue()
         
-        # Main content
         if st.session_state.current_data:
             # Current telemetry
             st.markdown("## 📡 Current Telemetry")
             
-            power_status = st.session_state.current_data.get('power_status', {})
-            radio_status = st.session_state.current_data.get('radio_status', {})
-            nvm_counters = st.session_state.current_data.get('nvm_counters', {})
-            system_info = st.session_state.current_data.get('system_info', {})
+            packet = st.session_state.current_data
             
             # Metrics row
             col1, col2, col3, col4, col5 = st.columns(5)
             
             with col1:
-                battery_v = power_status.get('battery_voltage', 0)
-                st.metric("🔋 Battery", f"{battery_v:.2f} V")
+                st.metric("🔋 Battery", f"{packet.battery_voltage:.2f} V")
             
             with col2:
-                rssi = radio_status.get('last_rssi', 'N/A')
-                st.metric("📡 Signal", f"{rssi} dBm")
+                st.metric("📡 Signal", f"{packet.rssi} dBm")
             
             with col3:
-                tasks = system_info.get('active_tasks', 0)
-                st.metric("⚙️ Tasks", f"{tasks}")
+                st.metric("⚙️ Tasks", f"{packet.active_tasks}")
             
             with col4:
-                errors = nvm_counters.get('state_errors', 0)
-                st.metric("🚨 Errors", f"{errors}")
+                st.metric("🚨 Errors", f"{packet.state_errors}")
             
             with col5:
-                uptime = power_status.get('uptime_seconds', 0)
-                st.metric("⏰ Uptime", f"{uptime:.1f} s")
+                st.metric("⏰ Uptime", f"{packet.uptime:.1f} s")
             
             # Plots
             st.markdown("## 📈 Real-Time Telemetry Graphs")
@@ -459,10 +630,38 @@ class IntegratedDashboard:
             # Empty plots
             fig = self.create_telemetry_plots()
             st.plotly_chart(fig, use_container_width=True)
+    
+    def run(self):
+        """Main dashboard interface"""
+        # Header
+        st.markdown("# 🛰️ BEEPSAT MISSION CONTROL DASHBOARD")
+        st.markdown("### Integrated Simulation & Real-Time Monitoring")
+        
+        # Main content; drawn before the sidebar so its statistics see this run's drain
+        self.telemetry_panel()
         
-        # Auto-refresh
-        time.sleep(1)
-        st.rerun()
+        # Sidebar - Mission Control
+        with st.sidebar:
+            st.markdown("## 🎮 Mission Control")
+            
+            # Status and controls; a full rerun lets the panels pick up the new refresh cadence
+            if st.session_state.monitoring:
+                st.markdown('<p class="status-connected">● MISSION ACTIVE</p>', unsafe_allow_html=True)
+                if st.button("🛑 Stop Mission", type="secondary"):
+                    self.stop_monitoring()
+                    st.rerun()
+            else:
+                st.markdown('<p class="status-disconnected">● MISSION INACTIVE</p>', unsafe_allow_html=True)
+                if st.button("🚀 Start Mission", type="primary"):
+                    self.start_monitoring()
+                    st.rerun()
+            
+            # Reset button
+            if st.button("🔄 Reset Mission"):
+                self.reset_mission()
+                st.rerun()
+            
+            self.mission_status_panel()
 
 def main():
     """Main function"""
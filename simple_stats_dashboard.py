@@ -6,14 +6,16 @@ Shows statistics in tabs without import issues
 
 import streamlit as st
 import plotly.graph_objects as go
+import numpy as np
 import json
 import time
 import os
 import sys
 import random
 import math
-from collections import deque
+import warnings
 from datetime import datetime
+from scipy import optimize, signal
 
 # Configure Streamlit page
 st.set_page_config(
@@ -64,6 +66,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _gaussian(x, amplitude, center, sigma, baseline):
+    """Gaussian peak on a constant baseline"""
+    return amplitude * np.exp(-0.5 * ((x - center) / sigma) ** 2) + baseline
+
 class SignalProcessor:
     """Signal processing utilities for peak detection and fitting"""
     
@@ -75,47 +81,42 @@ class SignalProcessor:
         Args:
             values: List of signal values
             min_height: Minimum height for peak detection
-            min_distance: Minimum distance between peaks (in indices)
+            min_distance: Minimum distance between peaks (in indices); of peaks
+                closer than this, the tallest is kept
         
         Returns:
-            dict with peak indices, heights, and properties
+            dict with peak indices, heights, and properties. Each properties
+            entry holds the peak's scipy prominence, its fractional width in
+            samples at half prominence, and the indices of its left and right
+            prominence bases
         """
         if len(values) < 3:
             return {'peaks': [], 'peak_heights': [], 'peak_properties': []}
         
-        peaks = []
-        peak_heights = []
-        peak_properties = []
-        
-        # Convert to list if needed
-        vals = list(values)
-        n = len(vals)
-        
-        # Find local maxima
-        for i in range(1, n - 1):
-            # Check if current point is higher than neighbors
-            if vals[i] > vals[i-1] and vals[i] > vals[i+1]:
-                # Apply minimum height filter
-                if min_height is None or vals[i] >= min_height:
-                    # Apply minimum distance filter
-                    if not peaks or (i - peaks[-1]) >= min_distance:
-                        peaks.append(i)
-                        peak_heights.append(vals[i])
-                        
-                        # Calculate peak properties
-                        prominence = SignalProcessor._calculate_prominence(vals, i)
-                        width = SignalProcessor._calculate_width(vals, i)
-                        
-                        peak_properties.append({
-                            'prominence': prominence,
-                            'width': width,
-                            'left_base': max(0, i - width//2),
-                            'right_base': min(n-1, i + width//2)
-                        })
+        arr = np.asarray(values, dtype=np.float64)
+        
+        # prominence=0 and width=0 accept every peak but make scipy report
+        # prominences, bases and half-height widths in the same pass
+        peaks, props = signal.find_peaks(
+            arr, height=min_height, distance=min_distance, prominence=0, width=0
+        )
+        
+        peak_properties = [
+            {
+                'prominence': prominence,
+                'width': width,
+                'left_base': left_base,
+                'right_base': right_base
+            }
+            for prominence, width, left_base, right_base in zip(
+                props['prominences'].tolist(), props['widths'].tolist(),
+                props['left_bases'].tolist(), props['right_bases'].tolist()
+            )
+        ]
         
         return {
-            'peaks': peaks,
-            'peak_heights': peak_heights,
+            'peaks': peaks.tolist(),
+            'peak_heights': arr[peaks].tolist(),
             'peak_properties': peak_properties,
             'total_peaks': len(peaks)
         }
@@ -129,7 +130,7 @@ class SignalProcessor:
             return {'valleys': [], 'valley_depths': [], 'total_valleys': 0}
         
         # Invert signal and find peaks to get valleys
-        inverted = [-v for v in values]
+        inverted = -np.asarray(values, dtype=np.float64)
         if max_height is not None:
             min_height_inverted = -max_height
         else:
@@ -144,65 +145,7 @@ class SignalProcessor:
         }
     
     @staticmethod
-    def _calculate_prominence(values, peak_idx):
-        """Calculate peak prominence (height above surrounding minima)"""
-        n = len(values)
-        peak_height = values[peak_idx]
-        
-        # Find minimum to the left
-        left_min = peak_height
-        for i in range(peak_idx - 1, -1, -1):
-            if values[i] < left_min:
-                left_min = values[i]
-        
-        # Find minimum to the right
-        right_min = peak_height
-        for i in range(peak_idx + 1, n):
-            if values[i] < right_min:
-                right_min = values[i]
-        
-        # Prominence is height above the higher of the two minima
-        reference_min = max(left_min, right_min)
-        return peak_height - reference_min
-    
-    @staticmethod
-    def _calculate_width(values, peak_idx, rel_height=0.5):
-        """Calculate peak width at relative height"""
-        n = len(values)
-        peak_height = values[peak_idx]
-        
-        # Find the base level
-        left_min = peak_height
-        right_min = peak_height
-        
-        for i in range(peak_idx - 1, -1, -1):
-            if values[i] < left_min:
-                left_min = values[i]
-        
-        for i in range(peak_idx + 1, n):
-            if values[i] < right_min:
-                right_min = values[i]
-        
-        base_level = max(left_min, right_min)
-        height_threshold = base_level + rel_height * (peak_height - base_level)
-        
-        # Find width at this height
-        left_width = 0
-        for i in range(peak_idx - 1, -1, -1):
-            if values[i] <= height_threshold:
-                break
-            left_width += 1
-        
-        right_width = 0
-        for i in range(peak_idx + 1, n):
-            if values[i] <= height_threshold:
-                break
-            right_width += 1
-        
-        return left_width + right_width + 1
-    
-    @staticmethod
-    def fit_gaussian_peak(x_data, y_data, peak_idx):
+    def fit_gaussian_peak(x_data, y_data, peak_idx, refine=False):
         """
         Fit a Gaussian curve to a peak using least-squares minimization
         
@@ -210,6 +153,7 @@ class SignalProcessor:
             x_data: X coordinates (indices or time)
             y_data: Y coordinates (signal values)
             peak_idx: Index of the peak center
+            refine: Polish the closed-form fit with nonlinear least squares
         
         Returns:
             dict with fitted parameters and quality metrics
@@ -221,10 +165,10 @@ class SignalProcessor:
             start_idx = max(0, peak_idx - window_size)
             end_idx = min(n, peak_idx + window_size + 1)
             
-            local_x = x_data[start_idx:end_idx]
-            local_y = y_data[start_idx:end_idx]
+            local_x = np.asarray(x_data[start_idx:end_idx], dtype=np.float64)
+            local_y = np.asarray(y_data[start_idx:end_idx], dtype=np.float64)
             
-            if len(local_y) < 3:
+            if local_y.size < 3:
                 return None
             
             # Initial parameter estimates
@@ -236,63 +180,78 @@ class SignalProcessor:
             amplitude = peak_height - baseline
             
             # Estimate width from data spread
-            sigma_estimate = len(local_y) / 6  # Rough estimate
+            sigma_estimate = local_y.size / 6  # Rough estimate
             
             # Simple least-squares fitting using normal equations
             # For Gaussian: y = A * exp(-0.5 * ((x - mu) / sigma)^2) + baseline
             # We'll use a simplified linear approximation in log space
             
             # Remove baseline
-            y_shifted = [max(y - baseline, 0.001) for y in local_y]  # Avoid log(0)
+            y_shifted = np.clip(local_y - baseline, 0.001, None)  # Avoid log(0)
             
             # Linear least squares for log-transformed Gaussian
             # log(y) ≈ log(A) - 0.5 * ((x - mu) / sigma)^2
-            log_y = [math.log(y) for y in y_shifted]
+            log_y = np.log(y_shifted)
             
             # Use the peak as center and fit width
-            x_centered = [(x - peak_center) for x in local_x]
-            x_squared = [x * x for x in x_centered]
+            x_centered = local_x - peak_center
+            x_squared = x_centered * x_centered
+            
+            # Weighted regression log(y) = a + b * x^2 (Guo's algorithm): y^2 weights
+            # keep near-baseline samples, whose logs are mostly noise, from dominating
+            weights = y_shifted * y_shifted
+            w_x2 = weights * x_squared
+            sum_w_x2 = w_x2.sum()
+            normal_matrix = np.array([[weights.sum(), sum_w_x2],
+                                      [sum_w_x2, np.dot(w_x2, x_squared)]])
+            normal_rhs = np.array([np.dot(weights, log_y), np.dot(w_x2, log_y)])
+            
+            # Solve normal equations (LinAlgError when singular)
+            a, b = np.linalg.solve(normal_matrix, normal_rhs)
+            
+            # Convert back to Gaussian parameters
+            fitted_amplitude = math.exp(a)
+            fitted_sigma = math.sqrt(-0.5 / b) if b < 0 else sigma_estimate
+            fitted_center = peak_center
+            fitted_baseline = baseline
+            
+            # The log-space fit is a close seed, so a few iterations of curve_fit
+            # also free up the center and baseline it had to hold fixed
+            if refine and local_y.size >= 5:
+                try:
+                    # Only the parameters are used, so a singular covariance is harmless
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore', optimize.OptimizeWarning)
+                        popt, _ = optimize.curve_fit(
+                            _gaussian, local_x, local_y,
+                            p0=(fitted_amplitude, fitted_center, fitted_sigma, fitted_baseline),
+                            maxfev=50
+                        )
+                    fitted_amplitude, fitted_center, fitted_sigma, fitted_baseline = popt
+                    fitted_sigma = abs(fitted_sigma)
+                except RuntimeError:
+                    pass  # No convergence within maxfev; keep the closed-form fit
+            
+            # Calculate R-squared
+            y_pred = _gaussian(local_x, fitted_amplitude, fitted_center, fitted_sigma, fitted_baseline)
+            
+            ss_res = np.sum((local_y - y_pred) ** 2)
+            ss_tot = np.sum((local_y - local_y.mean()) ** 2)
             
-            # Linear regression: log(y) = a + b * x^2
-            n_points = len(log_y)
-            sum_x2 = sum(x_squared)
-            sum_x4 = sum(x * x for x in x_squared)
-            sum_y = sum(log_y)
-            sum_x2y = sum(x_squared[i] * log_y[i] for i in range(n_points))
+            r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
             
-            # Solve normal equations
-            if n_points * sum_x4 - sum_x2 * sum_x2 != 0:
-                b = (n_points * sum_x2y - sum_x2 * sum_y) / (n_points * sum_x4 - sum_x2 * sum_x2)
-                a = (sum_y - b * sum_x2) / n_points
-                
-                # Convert back to Gaussian parameters
-                fitted_amplitude = math.exp(a)
-                fitted_sigma = math.sqrt(-0.5 / b) if b < 0 else sigma_estimate
-                fitted_center = peak_center
-                fitted_baseline = baseline
-                
-                # Calculate R-squared
-                y_pred = [fitted_amplitude * math.exp(-0.5 * ((x - fitted_center) / fitted_sigma) ** 2) + fitted_baseline 
-                         for x in local_x]
-                
-                ss_res = sum((local_y[i] - y_pred[i]) ** 2 for i in range(len(local_y)))
-                y_mean = sum(local_y) / len(local_y)
-                ss_tot = sum((y - y_mean) ** 2 for y in local_y)
-                
-                r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
-                
-                return {
-                    'amplitude': fitted_amplitude,
-                    'center': fitted_center,
-                    'sigma': fitted_sigma,
-                    'baseline': fitted_baseline,
-                    'r_squared': max(0, min(1, r_squared)),
-                    'peak_area': fitted_amplitude * fitted_sigma * math.sqrt(2 * math.pi),
-                    'fwhm': 2.355 * fitted_sigma,  # Full Width at Half Maximum
-                    'quality': 'good' if r_squared > 0.8 else 'fair' if r_squared > 0.5 else 'poor'
-                }
+            return {
+                'amplitude': fitted_amplitude,
+                'center': fitted_center,
+                'sigma': fitted_sigma,
+                'baseline': fitted_baseline,
+                'r_squared': max(0, min(1, r_squared)),
+                'peak_area': fitted_amplitude * fitted_sigma * math.sqrt(2 * math.pi),
+                'fwhm': 2.355 * fitted_sigma,  # Full Width at Half Maximum
+                'quality': 'good' if r_squared > 0.8 else 'fair' if r_squared > 0.5 else 'poor'
+            }
             
-        except (ValueError, ZeroDivisionError, OverflowError):
+        except (ValueError, ZeroDivisionError, OverflowError, np.linalg.LinAlgError):
             pass
         
         # Fallback simple characterization
@@ -328,13 +287,15 @@ class SignalProcessor:
                 'summary': f"Insufficient data for {signal_name} peak analysis"
             }
         
+        values = np.asarray(values, dtype=np.float64)
+        
         # Create index array for fitting
-        indices = list(range(len(values)))
+        indices = np.arange(len(values))
         
         # Adaptive thresholds based on signal statistics
-        mean_val = sum(values) / len(values)
-        max_val = max(values)
-        min_val = min(values)
+        mean_val = values.mean()
+        max_val = values.max()
+        min_val = values.min()
         signal_range = max_val - min_val
         
         # Set thresholds as percentages of signal range
@@ -350,8 +311,11 @@ class SignalProcessor:
         fitted_peaks = []
         if peaks_result['peaks']:
             for i, peak_idx in enumerate(peaks_result['peaks']):
-                if peaks_result['peak_properties'][i]['prominence'] > 0.05 * signal_range:
-                    fit_result = SignalProcessor.fit_gaussian_peak(indices, values, peak_idx)
+                prominence = peaks_result['peak_properties'][i]['prominence']
+                if prominence > 0.05 * signal_range:
+                    fit_result = SignalProcessor.fit_gaussian_peak(
+                        indices, values, peak_idx, refine=prominence > 0.1 * signal_range
+                    )
                     if fit_result:
                         fitted_peaks.append({
                             'index': peak_idx,
@@ -400,52 +364,43 @@ class SimpleStatCalculator:
     """Simple statistics calculator"""
     
     @staticmethod
-    def calculate_stats(values):
-        """Calculate comprehensive statistics for a list of values"""
-        if not values or len(values) == 0:
-            return None
+    def calculate_stats(values, running=None):
+        """Calculate comprehensive statistics for a list of values
         
-        vals = [float(v) for v in values if v is not None]
-        if not vals:
+        running is an optional RunningStats tracking the same window; when given,
+        mean/std come from it instead of a pass over the values.
+        """
+        vals = np.asarray(values, dtype=np.float64)
+        if not vals.size:
             return None
         
-        n = len(vals)
-        mean_val = sum(vals) / n
-        min_val = min(vals)
-        max_val = max(vals)
+        n = vals.size
+        min_val = vals.min()
+        max_val = vals.max()
         range_val = max_val - min_val
         
-        # Standard deviation
-        variance = sum((x - mean_val) ** 2 for x in vals) / (n - 1) if n > 1 else 0
-        std_val = math.sqrt(variance)
+        # Mean and standard deviation
+        if running is not None and running.n == n:
+            mean_val, std_val = running.mean, running.std
+        else:
+            mean_val = vals.mean()
+            std_val = vals.std(ddof=1) if n > 1 else 0.0
         
         # Median
-        sorted_vals = sorted(vals)
-        if n % 2 == 0:
-            median_val = (sorted_vals[n//2 - 1] + sorted_vals[n//2]) / 2
-        else:
-            median_val = sorted_vals[n//2]
+        median_val = np.median(vals)
         
         # Trend (simple linear regression)
         if n > 2:
-            x_vals = list(range(n))
-            x_mean = sum(x_vals) / n
-            y_mean = mean_val
-            
-            numerator = sum((x_vals[i] - x_mean) * (vals[i] - y_mean) for i in range(n))
-            denominator = sum((x - x_mean) ** 2 for x in x_vals)
-            
-            slope = numerator / denominator if denominator != 0 else 0
+            # x is always 0..n-1, so the least-squares fit has a closed form
+            x_centered = np.arange(n) - (n - 1) / 2
+            slope = np.dot(x_centered, vals) / (n * (n * n - 1) / 12)
         else:
             slope = 0
         
         # Anomalies (simple z-score)
         anomalies = []
         if std_val > 0:
-            for i, val in enumerate(vals):
-                z_score = abs(val - mean_val) / std_val
-                if z_score > 2.5:
-                    anomalies.append(i)
+            anomalies = np.flatnonzero(np.abs(vals - mean_val) / std_val > 2.5).tolist()
         
         # Coefficient of variation
         cv = (std_val / abs(mean_val)) * 100 if mean_val != 0 else 0
@@ -463,6 +418,48 @@ class SimpleStatCalculator:
             'cv': cv
         }
 
+class RunningStats:
+    """Welford running mean/variance over a sliding window of values"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget every value in the window"""
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def push(self, x):
+        """Add a value entering the window"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+    
+    def pop(self, x):
+        """Remove a value leaving the window"""
+        if self.n <= 1:
+            self.reset()
+            return
+        delta = x - self.mean
+        self.n -= 1
+        self.mean -= delta / self.n
+        self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+    
+    @property
+    def variance(self):
+        """Sample variance, matching calculate_stats"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+    
+    @property
+    def std(self):
+        """Sample standard deviation, matching calculate_stats"""
+        return self.variance ** 0.5
+
+# Packets' worth of random samples pre-generated per simulator batch
+RANDOM_BATCH_SIZE = 1024
+
 class BeepSatSimulator:
     """BeepSat simulator"""
     
@@ -475,13 +472,38 @@ class BeepSatSimulator:
         self.gs_responses = random.randint(5, 30)
         self.rssi_base = -55
         
+        # Batched randomness: one list per sampled quantity, one entry per packet
+        self.rng = np.random.default_rng()
+        self.random_batch = self._draw_batch()
+        self.batch_index = -1  # advanced before each packet
+    
+    def _draw_batch(self):
+        """Pre-generate RANDOM_BATCH_SIZE packets' worth of random samples"""
+        rng = self.rng
+        n = RANDOM_BATCH_SIZE
+        # Battery spikes (5%) and RSSI fades (3%) are folded into the noise
+        battery_spikes = np.where(rng.random(n) < 0.05, rng.uniform(0.2, 0.6, n), 0.0)
+        rssi_fades = np.where(rng.random(n) < 0.03, rng.uniform(15, 25, n), 0.0)
+        charging = rng.random(n) < 0.6
+        return {
+            'battery_noise': (rng.uniform(-self.battery_noise, self.battery_noise, n) + battery_spikes).tolist(),
+            'rssi_noise': (rng.uniform(-8, 8, n) - rssi_fades).tolist(),
+            'error_event': (rng.random(n) < 0.001).tolist(),
+            'gs_event': (rng.random(n) < 0.005).tolist(),
+            'charge_current': np.where(charging, rng.uniform(0.0, 0.8, n), 0.0).tolist()
+        }
+    
+    def _advance_batch(self):
+        """Move to the next packet's samples, refilling the batch when exhausted"""
+        self.batch_index += 1
+        if self.batch_index == RANDOM_BATCH_SIZE:
+            self.random_batch = self._draw_batch()
+            self.batch_index = 0
+    
     def get_battery_voltage(self, current_time):
         elapsed_hours = (current_time - self.start_time) / 3600
         trend = -0.02 * elapsed_hours
-        noise = random.uniform(-self.battery_noise, self.battery_noise)
-        
-        if random.random() < 0.05:
-            noise += random.uniform(0.2, 0.6)
+        noise = self.random_batch['battery_noise'][self.batch_index]
         
         voltage = self.battery_base + trend + noise
         return max(min(voltage, 8.0), 5.8)
@@ -489,19 +511,19 @@ class BeepSatSimulator:
     def get_rssi(self, current_time):
         orbital_phase = (current_time % 240) / 240 * 2 * math.pi
         orbital_effect = 6 * math.sin(orbital_phase)
-        noise = random.uniform(-8, 8)
-        
-        if random.random() < 0.03:
-            noise -= random.uniform(15, 25)
+        noise = self.random_batch['rssi_noise'][self.batch_index]
         
         return max(min(self.rssi_base + orbital_effect + noise, -25), -95)
     
     def generate_telemetry(self):
         current_time = time.time()
+        self._advance_batch()
+        batch = self.random_batch
+        i = self.batch_index
         
-        if random.random() < 0.001:
+        if batch['error_event'][i]:
             self.state_errors += 1
-        if random.random() < 0.005:
+        if batch['gs_event'][i]:
             self.gs_responses += 1
         
         battery_v = self.get_battery_voltage(current_time)
@@ -513,7 +535,7 @@ class BeepSatSimulator:
             'power_status': {
                 'battery_voltage': battery_v,
                 'uptime_seconds': current_time - self.start_time,
-                'charge_current': random.uniform(0.0, 0.8) if random.random() < 0.6 else 0.0
+                'charge_current': batch['charge_current'][i]
             },
             'radio_status': {
                 'last_rssi': rssi,
@@ -530,12 +552,54 @@ class BeepSatSimulator:
             }
         }
 
+# Telemetry history kept for plots and statistics
+TELEMETRY_WINDOW = 200
+METRIC_FIELDS = (
+    'timestamps', 'battery_voltages', 'rssi_values', 'error_counts', 'charge_currents', 'uptime_values'
+)
+ANALYZED_FIELDS = ('battery_voltages', 'rssi_values', 'error_counts', 'charge_currents')
+
+# Ring column dtypes; epoch timestamps keep float64 for sub-second precision
+RING_DTYPES = {
+    'timestamps': np.float64,
+    'battery_voltages': np.float32,
+    'rssi_values': np.float32,
+    'error_counts': np.int16,
+    'charge_currents': np.float32,
+    'uptime_values': np.float32
+}
+
+def to_local_datetime64(timestamps):
+    """Convert epoch seconds to local-time datetime64 values for plotting"""
+    offset = datetime.now().astimezone().utcoffset().total_seconds()
+    return ((timestamps + offset) * 1000).astype('datetime64[ms]')
+
+def telemetry_row(telemetry):
+    """Pull one ring row out of a telemetry packet, in METRIC_FIELDS order"""
+    power = telemetry['power_status']
+    return (
+        telemetry['timestamp'],
+        power['battery_voltage'],
+        telemetry['radio_status']['last_rssi'],
+        telemetry['nvm_counters']['state_errors'],
+        power['charge_current'],
+        power['uptime_seconds']
+    )
+
 # Initialize session state
 def initialize_session_state():
     if 'monitoring' not in st.session_state:
         st.session_state.monitoring = False
-    if 'telemetry_data' not in st.session_state:
-        st.session_state.telemetry_data = deque(maxlen=200)
+    if 'telemetry_ring' not in st.session_state:
+        # One preallocated column per metric, written in circular order
+        st.session_state.telemetry_ring = {
+            field: np.zeros(TELEMETRY_WINDOW, dtype=RING_DTYPES[field]) for field in METRIC_FIELDS
+        }
+        st.session_state.ring_index = 0
+        st.session_state.telemetry_count = 0
+        st.session_state.metric_window = None
+    if 'running_stats' not in st.session_state:
+        st.session_state.running_stats = {field: RunningStats() for field in ANALYZED_FIELDS}
     if 'current_data' not in st.session_state:
         st.session_state.current_data = {}
     if 'simulator' not in st.session_state:
@@ -562,7 +626,11 @@ def stop_monitoring():
 def reset_mission():
     if st.session_state.monitoring:
         stop_monitoring()
-    st.session_state.telemetry_data.clear()
+    st.session_state.ring_index = 0
+    st.session_state.telemetry_count = 0
+    st.session_state.metric_window = None
+    for running in st.session_state.running_stats.values():
+        running.reset()
     st.session_state.current_data = {}
     st.session_state.mission_start_time = None
     st.session_state.last_telemetry_time = 0
@@ -574,41 +642,74 @@ def generate_telemetry_data():
         current_time - st.session_state.last_telemetry_time >= 0.5):
         
         telemetry = st.session_state.simulator.generate_telemetry()
-        st.session_state.telemetry_data.append(telemetry)
+        ring = st.session_state.telemetry_ring
+        running_stats = st.session_state.running_stats
+        idx = st.session_state.ring_index
+        
+        # Once the ring is full the slot being overwritten leaves the window
+        if st.session_state.telemetry_count == TELEMETRY_WINDOW:
+            for field, running in running_stats.items():
+                running.pop(float(ring[field][idx]))
+        
+        for field, value in zip(METRIC_FIELDS, telemetry_row(telemetry)):
+            ring[field][idx] = value
+        
+        for field, running in running_stats.items():
+            running.push(float(ring[field][idx]))
+        st.session_state.ring_index = (idx + 1) % TELEMETRY_WINDOW
+        st.session_state.telemetry_count = min(
+            st.session_state.telemetry_count + 1, TELEMETRY_WINDOW
+        )
+        st.session_state.metric_window = None
         st.session_state.current_data = telemetry
         st.session_state.last_telemetry_time = current_time
         st.session_state.data_points_generated += 1
         return True
     return False
 
+def extract_metric_data():
+    """Extract time series data for analysis, oldest point first"""
+    # Every tab reads the window; unroll it once per new point
+    if st.session_state.metric_window is not None:
+        return st.session_state.metric_window
+    
+    ring = st.session_state.telemetry_ring
+    count = st.session_state.telemetry_count
+    idx = st.session_state.ring_index
+    
+    # Until the ring wraps the columns are already in order and can be sliced
+    if count < TELEMETRY_WINDOW or idx == 0:
+        metrics = {field: ring[field][:count] for field in METRIC_FIELDS}
+    else:
+        metrics = {field: np.roll(ring[field], -idx) for field in METRIC_FIELDS}
+    st.session_state.metric_window = metrics
+    return metrics
+
 def extract_metric_arrays():
     """Extract arrays of values for statistical analysis"""
-    if not st.session_state.telemetry_data:
-        return [], [], [], []
-    
-    battery_voltages = []
-    rssi_values = []
-    error_counts = []
-    charge_currents = []
-    
-    for data in st.session_state.telemetry_data:
-        power_status = data.get('power_status', {})
-        battery_voltages.append(power_status.get('battery_voltage', 0))
-        charge_currents.append(power_status.get('charge_current', 0))
-        
-        radio_status = data.get('radio_status', {})
-        rssi_values.append(radio_status.get('last_rssi', -100))
-        
-        nvm_counters = data.get('nvm_counters', {})
-        error_counts.append(nvm_counters.get('state_errors', 0))
-    
-    return battery_voltages, rssi_values, error_counts, charge_currents
+    metrics = extract_metric_data()
+    return tuple(metrics[field] for field in ANALYZED_FIELDS)
+
+# Reruns without a new telemetry point (widget clicks, tab switches) pass the same
+# window again, so these turn into a hash lookup instead of a full recompute
+@st.cache_data(max_entries=8, ttl=60)
+def cached_stats(values, _running=None):
+    """SimpleStatCalculator.calculate_stats for a window array
+    
+    _running is left out of the cache key; it only matters on a miss.
+    """
+    return SimpleStatCalculator.calculate_stats(values, _running)
+
+@st.cache_data(max_entries=8, ttl=60)
+def cached_peak_analysis(values, signal_name):
+    """SignalProcessor.analyze_signal_peaks for a window array"""
+    return SignalProcessor.analyze_signal_peaks(values, signal_name)
 
 def display_statistics():
     """Display statistics in the Statistics tab"""
-    if len(st.session_state.telemetry_data) < 3:
+    if st.session_state.telemetry_count < 3:
         st.warning("📊 Statistical analysis will appear after collecting more data")
-        st.info(f"Current data points: {len(st.session_state.telemetry_data)} / 3 required")
+        st.info(f"Current data points: {st.session_state.telemetry_count} / 3 required")
         
         st.markdown("### 📊 Available Statistics (when ready):")
         st.write("🔋 **Battery:** Average, Std Dev, Range, Trend, Anomalies")
@@ -622,11 +723,11 @@ def display_statistics():
     battery_voltages, rssi_values, error_counts, charge_currents = extract_metric_arrays()
     
     # Calculate statistics
-    calc = SimpleStatCalculator()
-    battery_stats = calc.calculate_stats(battery_voltages)
-    rssi_stats = calc.calculate_stats(rssi_values)
-    error_stats = calc.calculate_stats(error_counts)
-    charge_stats = calc.calculate_stats(charge_currents)
+    running_stats = st.session_state.running_stats
+    battery_stats = cached_stats(battery_voltages, running_stats['battery_voltages'])
+    rssi_stats = cached_stats(rssi_values, running_stats['rssi_values'])
+    error_stats = cached_stats(error_counts, running_stats['error_counts'])
+    charge_stats = cached_stats(charge_currents, running_stats['charge_currents'])
     
     # Display statistics in columns
     st.markdown("## 📊 MISSION STATISTICS")
@@ -719,8 +820,8 @@ def display_statistics():
     
     # Perform peak analysis on battery and RSSI signals
     if len(battery_voltages) >= 5:
-        battery_peak_analysis = SignalProcessor.analyze_signal_peaks(battery_voltages, "Battery Voltage")
-        rssi_peak_analysis = SignalProcessor.analyze_signal_peaks(rssi_values, "RSSI Signal")
+        battery_peak_analysis = cached_peak_analysis(battery_voltages, "Battery Voltage")
+        rssi_peak_analysis = cached_peak_analysis(rssi_values, "RSSI Signal")
         
         col1, col2 = st.columns(2)
         
@@ -858,13 +959,16 @@ def display_signal_summary(battery_analysis, rssi_analysis):
 
 def create_simple_plots():
     """Create simple plots without subplots to avoid pandas conflict"""
-    if not st.session_state.telemetry_data:
+    if not st.session_state.telemetry_count:
         st.info("Start mission to see graphs")
         return
     
-    battery_voltages, rssi_values, error_counts, _ = extract_metric_arrays()
-    timestamps = [datetime.fromtimestamp(d['timestamp']) for d in st.session_state.telemetry_data]
-    uptime_values = [d['power_status']['uptime_seconds'] for d in st.session_state.telemetry_data]
+    metrics = extract_metric_data()
+    battery_voltages = metrics['battery_voltages']
+    rssi_values = metrics['rssi_values']
+    error_counts = metrics['error_counts']
+    uptime_values = metrics['uptime_values']
+    timestamps = to_local_datetime64(metrics['timestamps'])
     
     # Create individual plots
     col1, col2 = st.columns(2)
@@ -877,10 +981,10 @@ def create_simple_plots():
         
         # Add peak annotations if enough data
         if len(battery_voltages) >= 5:
-            battery_peak_analysis = SignalProcessor.analyze_signal_peaks(battery_voltages, "Battery")
+            battery_peak_analysis = cached_peak_analysis(battery_voltages, "Battery Voltage")
             if battery_peak_analysis['peak_indices']:
-                peak_timestamps = [timestamps[i] for i in battery_peak_analysis['peak_indices']]
-                peak_values = [battery_voltages[i] for i in battery_peak_analysis['peak_indices']]
+                peak_timestamps = timestamps[battery_peak_analysis['peak_indices']]
+                peak_values = battery_voltages[battery_peak_analysis['peak_indices']]
                 fig1.add_trace(go.Scatter(x=peak_timestamps, y=peak_values, mode='markers',
                                         name='Peaks', marker=dict(color='red', size=8, symbol='triangle-up')))
         
@@ -904,15 +1008,15 @@ def create_simple_plots():
         
         # Add peak annotations if enough data
         if len(rssi_values) >= 5:
-            rssi_peak_analysis = SignalProcessor.analyze_signal_peaks(rssi_values, "RSSI")
+            rssi_peak_analysis = cached_peak_analysis(rssi_values, "RSSI Signal")
             if rssi_peak_analysis['peak_indices']:
-                peak_timestamps = [timestamps[i] for i in rssi_peak_analysis['peak_indices']]
-                peak_values = [rssi_values[i] for i in rssi_peak_analysis['peak_indices']]
+                peak_timestamps = timestamps[rssi_peak_analysis['peak_indices']]
+                peak_values = rssi_values[rssi_peak_analysis['peak_indices']]
                 fig2.add_trace(go.Scatter(x=peak_timestamps, y=peak_values, mode='markers',
                                         name='Peaks', marker=dict(color='red', size=8, symbol='triangle-up')))
             if rssi_peak_analysis['valley_indices']:
-                valley_timestamps = [timestamps[i] for i in rssi_peak_analysis['valley_indices']]
-                valley_values = [rssi_values[i] for i in rssi_peak_analysis['valley_indices']]
+                valley_timestamps = timestamps[rssi_peak_analysis['valley_indices']]
+                valley_values = rssi_values[rssi_peak_analysis['valley_indices']]
                 fig2.add_trace(go.Scatter(x=valley_timestamps, y=valley_values, mode='markers',
                                         name='Valleys', marker=dict(color='orange', size=8, symbol='triangle-down')))
         
@@ -930,25 +1034,20 @@ def create_simple_plots():
 
 def display_data_table():
     """Display raw telemetry data"""
-    if not st.session_state.telemetry_data:
+    if not st.session_state.telemetry_count:
         st.info("No telemetry data available yet. Start the mission to see data.")
         return
     
     st.markdown("### Recent Telemetry Data")
     
     # Show last 15 data points in a simple format
-    data_points = list(st.session_state.telemetry_data)[-15:]
+    metrics = extract_metric_data()
+    data_points = list(zip(*(metrics[field][-15:].tolist() for field in (
+        'timestamps', 'battery_voltages', 'rssi_values', 'error_counts', 'uptime_values'
+    ))))
     
-    for i, data in enumerate(data_points):
-        power = data.get('power_status', {})
-        radio = data.get('radio_status', {})
-        counters = data.get('nvm_counters', {})
-        
-        timestamp = datetime.fromtimestamp(data.get('timestamp', 0)).strftime("%H:%M:%S")
-        battery_v = power.get('battery_voltage', 0)
-        rssi = radio.get('last_rssi', 0)
-        errors = counters.get('state_errors', 0)
-        uptime = power.get('uptime_seconds', 0)
+    for ts, battery_v, rssi, errors, uptime in data_points:
+        timestamp = datetime.fromtimestamp(ts).strftime("%H:%M:%S")
         
         col1, col2, col3, col4, col5 = st.columns(5)
         with col1:
@@ -962,11 +1061,11 @@ def display_data_table():
         with col5:
             st.write(f"{uptime:.1f} s")
     
-    st.write(f"**Showing last {len(data_points)} of {len(st.session_state.telemetry_data)} total data points**")
+    st.write(f"**Showing last {len(data_points)} of {st.session_state.telemetry_count} total data points**")
 
 def display_mission_report():
     """Generate and display a comprehensive mission summary report"""
-    if len(st.session_state.telemetry_data) < 5:
+    if st.session_state.telemetry_count < 5:
         st.info("📋 Mission report will be available after collecting sufficient data (minimum 5 data points)")
         st.markdown("### What the Mission Report Will Include:")
         st.write("• **Mission Overview** - Duration, data points collected, system performance")
@@ -981,11 +1080,11 @@ def display_mission_report():
     battery_voltages, rssi_values, error_counts, charge_currents = extract_metric_arrays()
     
     # Calculate comprehensive statistics
-    calc = SimpleStatCalculator()
-    battery_stats = calc.calculate_stats(battery_voltages)
-    rssi_stats = calc.calculate_stats(rssi_values)
-    error_stats = calc.calculate_stats(error_counts)
-    charge_stats = calc.calculate_stats(charge_currents)
+    running_stats = st.session_state.running_stats
+    battery_stats = cached_stats(battery_voltages, running_stats['battery_voltages'])
+    rssi_stats = cached_stats(rssi_values, running_stats['rssi_values'])
+    error_stats = cached_stats(error_counts, running_stats['error_counts'])
+    charge_stats = cached_stats(charge_currents, running_stats['charge_currents'])
     
     # Mission duration
     if st.session_state.mission_start_time:
@@ -1006,8 +1105,8 @@ def display_mission_report():
     mission_status = "🟢 COMPLETED" if not st.session_state.monitoring else "🟡 IN PROGRESS"
     st.markdown(f"**Mission Status:** {mission_status}")
     st.markdown(f"**Mission Duration:** {duration_minutes}m {duration_seconds}s")
-    st.markdown(f"**Data Points Collected:** {len(st.session_state.telemetry_data)}")
-    st.markdown(f"**Data Collection Rate:** {len(st.session_state.telemetry_data) / max(mission_duration/60, 1):.1f} points/minute")
+    st.markdown(f"**Data Points Collected:** {st.session_state.telemetry_count}")
+    st.markdown(f"**Data Collection Rate:** {st.session_state.telemetry_count / max(mission_duration/60, 1):.1f} points/minute")
     
     # Overall mission health score
     health_score = calculate_mission_health_score(battery_stats, rssi_stats, error_stats)
@@ -1409,7 +1508,7 @@ def main():
             reset_mission()
             st.rerun()
         
-        st.metric("Data Points", len(st.session_state.telemetry_data))
+        st.metric("Data Points", st.session_state.telemetry_count)
         st.metric("Generated", st.session_state.data_points_generated)
     
     # Current telemetry